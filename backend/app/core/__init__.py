@@ -6,10 +6,15 @@ from .config import settings
 from .github_collector import GitHubCollector
 from .claude_client import ClaudeClient
 from .post_generator import PostGenerator
+from .post_cache import PostCache
+from .post_index import PostIndex, post_index
 
 __all__ = [
     "settings",
     "GitHubCollector", 
     "ClaudeClient",
-    "PostGenerator"
+    "PostGenerator",
+    "PostCache",
+    "PostIndex",
+    "post_index"
 ]
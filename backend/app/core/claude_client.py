@@ -1,6 +1,8 @@
 import logging
 import os
 import json
+import functools
+import httpx
 from typing import Dict, Any, Optional, List
 from anthropic import Anthropic
 from anthropic.types import Message
@@ -11,10 +13,23 @@ from .config import settings
 
 logger = logging.getLogger(__name__)
 
+@functools.cache
+def _load_system_prompt() -> str:
+    # Read once; a missing file raises and is retried on the next call rather than cached
+    prompt_file = os.path.join("app", "prompts", "system_prompt.txt")
+    
+    try:
+        with open(prompt_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.error(f"System prompt file {prompt_file} not found!")
+        raise
+
 class ClaudeClient:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: httpx.Client = None):
         self.api_key = api_key or settings.anthropic_api_key
-        self.client = Anthropic(api_key=self.api_key)
+        # A shared http_client lets every ClaudeClient reuse one pooled HTTP/2 connection
+        self.client = Anthropic(api_key=self.api_key, http_client=http_client)
         self.model = settings.claude_model
         
     def load_main_prompt(self) -> str:
@@ -31,6 +46,10 @@ class ClaudeClient:
             logger.error(f"Error loading main prompt: {e}")
             raise
     
+    def load_system_prompt(self) -> str:
+        """Load the static instructions sent as the system prompt"""
+        return _load_system_prompt()
+    
     def _prepare_commit_data_for_prompt(self, commits: CommitCollection) -> Dict[str, Any]:
         """Prepare commit data in a format suitable for the prompt"""
         
@@ -145,11 +164,12 @@ class ClaudeClient:
             
             logger.info(f"Generating post content with Claude for {commits.repository}")
             
-            # Call Claude API
+            # Call Claude API; the static instructions go in the system prompt
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.7,
+                system=self.load_system_prompt(),
                 messages=[
                     {
                         "role": "user",
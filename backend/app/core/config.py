@@ -15,12 +15,27 @@ class Settings:
         # Claude AI Configuration
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY", "")
         self.claude_model = os.getenv("CLAUDE_MODEL", "claude-3-sonnet-20240229")
+        self.llm_cache_enabled = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+        self.llm_cache_ttl_hours = float(os.getenv("LLM_CACHE_TTL_HOURS", "24"))
+        # Minimum commit-message similarity for reusing a cached post; above 1 disables near-matching
+        self.semantic_cache_threshold = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
         
         # App Configuration
         self.app_name = os.getenv("APP_NAME", "AI GitHub Explainer")
         self.debug = os.getenv("DEBUG", "False").lower() == "true"
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
         self.max_commits_per_hour = int(os.getenv("MAX_COMMITS_PER_HOUR", "100"))
+        self.max_concurrent_requests = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
+        self.background_workers = int(os.getenv("BACKGROUND_WORKERS", "4"))
+        self.job_queue_size = int(os.getenv("JOB_QUEUE_SIZE", "100"))
+        self.health_cache_ttl = float(os.getenv("HEALTH_CACHE_TTL", "10"))
+        self.generate_post_rate_limit = int(os.getenv("GENERATE_POST_RATE_LIMIT", "10"))
+        self.generate_post_rate_period = float(os.getenv("GENERATE_POST_RATE_PERIOD", "60"))
+        # Peers allowed to report the client address via X-Real-IP / X-Forwarded-For (the nginx proxy)
+        trusted_proxies_str = os.getenv("TRUSTED_PROXIES", "127.0.0.1/32,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16")
+        self.trusted_proxies = [net.strip() for net in trusted_proxies_str.split(",") if net.strip()]
+        self.batch_dedup_ttl = float(os.getenv("BATCH_DEDUP_TTL", "120"))
+        self.batch_dedup_size = int(os.getenv("BATCH_DEDUP_SIZE", "1024"))
         
         # Commit collection interval
         self.commit_collection_interval = int(os.getenv("COMMIT_COLLECTION_INTERVAL", "3600"))
@@ -28,6 +43,8 @@ class Settings:
         # Output Configuration
         self.output_dir = os.getenv("OUTPUT_DIR", "./data/posts")
         self.commit_data_dir = os.getenv("COMMIT_DATA_DIR", "./data/commits")
+        self.post_cache_dir = os.getenv("POST_CACHE_DIR", "./data/post_cache")
+        self.post_index_path = os.getenv("POST_INDEX_PATH", "./data/posts_index.sqlite")
         self.static_files_dir = os.getenv("STATIC_FILES_DIR", "./static")
         
         # Social Media Configuration
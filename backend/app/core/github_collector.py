@@ -1,5 +1,5 @@
 import re
-import json
+import orjson
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
@@ -14,7 +14,8 @@ logger = logging.getLogger(__name__)
 class GitHubCollector:
     def __init__(self, token: str = None):
         self.token = token or settings.github_token
-        self.github = Github(self.token)
+        # Size the keep-alive pool to the number of concurrent GitHub calls the app allows
+        self.github = Github(self.token, pool_size=settings.max_concurrent_requests)
         self.rate_limit_remaining = None
         
     def _classify_commit_type(self, message: str, files: List[str]) -> CommitType:
@@ -221,21 +222,11 @@ class GitHubCollector:
     def save_commits_to_file(self, commits: CommitCollection, filepath: str):
         """Save commits to JSON file"""
         try:
-            # Convert to dict for JSON serialization
-            data = commits.dict()
+            # orjson writes datetimes as ISO strings and enum keys (commit_types) by value
+            data = orjson.dumps(commits.model_dump(), option=orjson.OPT_NON_STR_KEYS)
             
-            # Convert datetime objects to ISO strings
-            data['start_time'] = commits.start_time.isoformat()
-            data['end_time'] = commits.end_time.isoformat()
-            
-            for commit_data in data['commits']:
-                if isinstance(commit_data['timestamp'], datetime):
-                    commit_data['timestamp'] = commit_data['timestamp'].isoformat()
-                elif hasattr(commit_data['timestamp'], 'isoformat'):
-                    commit_data['timestamp'] = commit_data['timestamp'].isoformat()
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(data)
             
             logger.info(f"Saved {len(commits.commits)} commits to {filepath}")
             
@@ -246,8 +237,8 @@ class GitHubCollector:
     def load_commits_from_file(self, filepath: str) -> CommitCollection:
         """Load commits from JSON file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Convert ISO strings back to datetime objects
             data['start_time'] = datetime.fromisoformat(data['start_time'])
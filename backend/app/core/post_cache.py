@@ -0,0 +1,143 @@
+import os
+import re
+import json
+import math
+import time
+import sqlite3
+import hashlib
+import logging
+from collections import Counter
+from contextlib import closing
+from typing import Dict, List, Optional
+
+from ..models.post import PostGenerationRequest, PostGenerationResponse
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+def _message_vector(messages: List[str]) -> Dict[str, int]:
+    """Bag-of-words term counts over the commit messages; order of commits doesn't matter"""
+    return Counter(_WORD_RE.findall(" ".join(messages).lower()))
+
+def _cosine(a: Dict[str, int], b: Dict[str, int]) -> float:
+    dot = sum(count * b.get(word, 0) for word, count in a.items())
+    norm = math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values()))
+    return dot / norm if norm else 0.0
+
+class PostCache:
+    """On-disk cache of generated posts.
+
+    Tier 1 matches the request and the exact commit set. Tier 2 matches the same
+    request options when the commit messages are nearly identical (cosine
+    similarity of their word counts at or above settings.semantic_cache_threshold)
+    and the cached post already covers every requested commit SHA, so a new
+    commit always triggers a fresh generation.
+    """
+
+    def __init__(self, cache_dir: str = None, ttl_hours: float = None, threshold: float = None):
+        self.cache_dir = cache_dir or settings.post_cache_dir
+        self.ttl_seconds = (ttl_hours if ttl_hours is not None else settings.llm_cache_ttl_hours) * 3600
+        self.threshold = threshold if threshold is not None else settings.semantic_cache_threshold
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index_path = os.path.join(self.cache_dir, "similar.sqlite")
+        with closing(sqlite3.connect(self.index_path)) as conn, conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS similar (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    vector TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    shas TEXT NOT NULL DEFAULT '[]'
+                )"""
+            )
+            # Indexes created before SHAs were tracked; their rows can never satisfy the SHA check
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(similar)")}
+            if "shas" not in columns:
+                conn.execute("ALTER TABLE similar ADD COLUMN shas TEXT NOT NULL DEFAULT '[]'")
+            conn.execute("CREATE INDEX IF NOT EXISTS similar_by_namespace ON similar (namespace)")
+
+    def _namespace(self, request: PostGenerationRequest) -> str:
+        # Includes the repository, so near-matches never cross repositories or templates
+        return hashlib.sha256(json.dumps(request.model_dump(mode="json"), sort_keys=True).encode("utf-8")).hexdigest()
+
+    def make_key(self, request: PostGenerationRequest, commit_shas: List[str]) -> str:
+        """Hash the request options together with the sorted commit SHAs"""
+        payload = {
+            "request": request.model_dump(mode="json"),
+            "commits": sorted(commit_shas)
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[PostGenerationResponse]:
+        """Return the cached response, or None if it is missing or expired"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                response = PostGenerationResponse.model_validate_json(f.read())
+            logger.info(f"Post cache hit: {key[:12]}")
+            return response
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading post cache entry {path}: {e}")
+            return None
+
+    def get_similar(self, request: PostGenerationRequest, messages: List[str],
+                    commit_shas: List[str]) -> Optional[PostGenerationResponse]:
+        """Return the closest cached response for the same request options that covers all commit_shas"""
+        if self.threshold > 1:
+            return None
+
+        vector = _message_vector(messages)
+        with closing(sqlite3.connect(self.index_path)) as conn, conn:
+            conn.execute("DELETE FROM similar WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            rows = conn.execute(
+                "SELECT key, vector, shas FROM similar WHERE namespace = ?", (self._namespace(request),)
+            ).fetchall()
+
+        wanted = set(commit_shas)
+        best_key, best_score = None, 0.0
+        for key, stored, stored_shas in rows:
+            if not wanted.issubset(json.loads(stored_shas)):
+                continue
+            score = _cosine(vector, json.loads(stored))
+            if score > best_score:
+                best_key, best_score = key, score
+
+        if best_key is None or best_score < self.threshold:
+            return None
+        logger.info(f"Post cache near-match {best_key[:12]} (similarity {best_score:.3f})")
+        return self.get(best_key)
+
+    def put(self, key: str, response: PostGenerationResponse,
+            request: Optional[PostGenerationRequest] = None, messages: Optional[List[str]] = None,
+            commit_shas: Optional[List[str]] = None):
+        """Store a successful response; with request, messages and SHAs it is also indexed for near-matches"""
+        if not response.success:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(response.model_dump_json())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error writing post cache entry {path}: {e}")
+            return
+
+        if request is not None and messages is not None and commit_shas is not None:
+            with closing(sqlite3.connect(self.index_path)) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO similar (key, namespace, vector, created_at, shas) VALUES (?, ?, ?, ?, ?)",
+                    (key, self._namespace(request), json.dumps(_message_vector(messages)), time.time(),
+                     json.dumps(sorted(commit_shas)))
+                )
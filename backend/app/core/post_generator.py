@@ -11,6 +11,7 @@ from ..models.post import (
 )
 from .claude_client import ClaudeClient
 from .config import settings
+from .post_index import post_index
 from ..utils.template_selector import TemplateSelector
 from ..utils.html_generator import HTMLGenerator
 from ..utils.chart_generator import ChartGenerator
@@ -18,8 +19,8 @@ from ..utils.chart_generator import ChartGenerator
 logger = logging.getLogger(__name__)
 
 class PostGenerator:
-    def __init__(self):
-        self.claude_client = ClaudeClient()
+    def __init__(self, claude_client: ClaudeClient = None):
+        self.claude_client = claude_client or ClaudeClient()
         self.template_selector = TemplateSelector()
         self.html_generator = HTMLGenerator()
         self.chart_generator = ChartGenerator()
@@ -184,6 +185,9 @@ class PostGenerator:
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             
+            stat = os.stat(filepath)
+            post_index.add_post(post.time_period, filename, stat.st_size, stat.st_ctime)
+            
             logger.info(f"Saved post to {filepath}")
             return filepath
             
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+import logging
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+class PostIndex:
+    """SQLite index of generated post files so listings don't rescan the output directory.
+
+    The filesystem stays the source of truth: the index is rebuilt from one
+    scandir pass on startup and kept current as new posts are written.
+    """
+
+    def __init__(self, db_path: str = None, output_dir: str = None):
+        self.db_path = db_path or settings.post_index_path
+        self.output_dir = output_dir or settings.output_dir
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS posts (
+                    time_period TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    PRIMARY KEY (time_period, filename)
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS posts_by_created ON posts (time_period, created_at DESC)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A short-lived connection per call keeps the index usable from worker threads
+        return sqlite3.connect(self.db_path)
+
+    def rebuild(self):
+        """Replace the index contents with the post files currently on disk"""
+        rows = []
+        if os.path.exists(self.output_dir):
+            with os.scandir(self.output_dir) as periods:
+                for period in periods:
+                    if not period.is_dir():
+                        continue
+                    with os.scandir(period.path) as entries:
+                        for entry in entries:
+                            if entry.name.endswith('.html'):
+                                stat = entry.stat()
+                                rows.append((period.name, entry.name, stat.st_ctime, stat.st_size))
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM posts")
+            conn.executemany("INSERT INTO posts VALUES (?, ?, ?, ?)", rows)
+        logger.info(f"Indexed {len(rows)} post files")
+
+    def add_post(self, time_period: str, filename: str, size: int, created_at: float):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?)",
+                (time_period, filename, created_at, size)
+            )
+
+    def list_posts(self, time_period: str, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Posts for a time period, newest first"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT filename, created_at, size FROM posts WHERE time_period = ? "
+                "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                (time_period, -1 if limit is None else limit, offset)
+            ).fetchall()
+
+        return [
+            {
+                "filename": filename,
+                "created_at": datetime.fromtimestamp(created_at),
+                "size": size,
+                "url": f"/posts/{time_period}/{filename}"
+            }
+            for filename, created_at, size in rows
+        ]
+
+    def version(self, time_period: str) -> str:
+        """Changes whenever a post for the period is added or removed; used to build ETags"""
+        with closing(self._connect()) as conn:
+            count, newest = conn.execute(
+                "SELECT COUNT(*), MAX(created_at) FROM posts WHERE time_period = ?", (time_period,)
+            ).fetchone()
+        return f"{count:x}-{int((newest or 0) * 1e6):x}"
+
+    def count_by_period(self) -> Dict[str, int]:
+        with closing(self._connect()) as conn:
+            return dict(conn.execute("SELECT time_period, COUNT(*) FROM posts GROUP BY time_period").fetchall())
+
+# Global index instance
+post_index = PostIndex()
@@ -1,6 +1,10 @@
 import os
-import json
-import requests
+import time
+import hashlib
+import asyncio
+import aiohttp
+import orjson
+from urllib.parse import urlencode
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,77 +17,297 @@ HEADERS = {
     "Accept": "application/vnd.github+json"
 }
 
-def get_all_repos(org):
-    repos = []
-    page = 1
-    while True:
-        url = f"https://api.github.com/orgs/{org}/repos?per_page=100&page={page}"
-        res = requests.get(url, headers=HEADERS)
-        data = res.json()
-        if not data:
-            break
-        repos.extend(data)
-        page += 1
-    return repos
+API_URL = "https://api.github.com"
+GRAPHQL_URL = f"{API_URL}/graphql"
+MAX_CONCURRENCY = 10
+MAX_RETRIES = 8
+BACKOFF_FACTOR = 1.0
+RETRY_STATUSES = {403, 429, 500, 502, 503, 504}
+
+# Кэш для условных запросов (ETag / If-None-Match): ответ 304 не расходует лимит API
+CACHE_DIR = os.getenv("GITHUB_CACHE_DIR", ".github_cache")
+ETAGS_FILE = os.path.join(CACHE_DIR, "etags.json")
+RESPONSES_DIR = os.path.join(CACHE_DIR, "responses")
+STATE_FILE = os.path.join(CACHE_DIR, "state.json")
+OUTPUT_FILE = "github_data.jsonl"
+ETAGS = {}
+
+def load_etags():
+    if os.path.exists(ETAGS_FILE):
+        with open(ETAGS_FILE, "rb") as f:
+            ETAGS.update(orjson.loads(f.read()))
+
+def save_etags():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(ETAGS_FILE, "wb") as f:
+        f.write(orjson.dumps(ETAGS))
+
+def load_state():
+    # Максимальный updated_at по каждому репозиторию с прошлого запуска
+    if os.path.exists(STATE_FILE):
+        with open(STATE_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    return {}
+
+def save_state(state):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(STATE_FILE, "wb") as f:
+        f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+
+def index_previous_data():
+    # Запоминаем только смещения строк, сами репозитории читаем по одному при обработке
+    offsets = {}
+    if os.path.exists(OUTPUT_FILE):
+        with open(OUTPUT_FILE, "rb") as f:
+            offset = 0
+            for line in f:
+                offsets[orjson.loads(line)["name"]] = offset
+                offset += len(line)
+    return offsets
+
+def read_previous_repo(offset):
+    with open(OUTPUT_FILE, "rb") as f:
+        f.seek(offset)
+        return orjson.loads(f.readline())
+
+def cached_response_path(url):
+    return os.path.join(RESPONSES_DIR, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+def read_cached_response(url):
+    with open(cached_response_path(url), "rb") as f:
+        cached = orjson.loads(f.read())
+    return cached["data"], cached["last"]
+
+def write_cached_response(url, etag, data, last):
+    os.makedirs(RESPONSES_DIR, exist_ok=True)
+    # Число страниц сохраняем вместе с телом: ответ 304 может прийти без заголовка Link
+    with open(cached_response_path(url), "wb") as f:
+        f.write(orjson.dumps({"data": data, "last": last}))
+    ETAGS[url] = etag
+
+# Issue вместе с комментариями одним запросом на страницу; pull request'ы в repository.issues не попадают
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $since: DateTime) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, states: [OPEN, CLOSED],
+           filterBy: {since: $since}, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state author { login }
+        labels(first: 20) { nodes { name } }
+        createdAt updatedAt closedAt body url
+        comments(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { author { login } createdAt body }
+        }
+      }
+    }
+  }
+}
+"""
+
+def page_url(path, page, **params):
+    query = urlencode({"per_page": 100, **params, "page": page})
+    return f"{API_URL}{path}?{query}"
+
+def last_page(res):
+    last = res.links.get("last")
+    if not last:
+        return 1
+    return int(last["url"].query.get("page", 1))
+
+def retry_delay(res, attempt):
+    """Сколько ждать перед повтором запроса, или None, если ответ повторять не нужно."""
+    # Успешный ответ (в том числе потративший последнюю единицу лимита) не повторяем
+    if res.status < 400 or attempt == MAX_RETRIES:
+        return None
+    if res.status in (403, 429):
+        if res.headers.get("X-RateLimit-Remaining") == "0":
+            # Исчерпан основной лимит: ждём до его сброса
+            reset = int(res.headers.get("X-RateLimit-Reset", time.time() + 60))
+            return max(reset - time.time(), 0) + 1
+        if "Retry-After" in res.headers:
+            # Вторичный лимит GitHub сообщает паузу явно
+            return int(res.headers["Retry-After"])
+    if res.status in RETRY_STATUSES:
+        return BACKOFF_FACTOR * (2 ** attempt)
+    return None
+
+async def fetch(session, semaphore, url, project=None):
+    headers = {}
+    if url in ETAGS and os.path.exists(cached_response_path(url)):
+        headers["If-None-Match"] = ETAGS[url]
+
+    for attempt in range(MAX_RETRIES + 1):
+        async with semaphore:
+            async with session.get(url, headers=headers) as res:
+                if res.status == 304:
+                    return read_cached_response(url)
+                delay = retry_delay(res, attempt)
+                if delay is None:
+                    res.raise_for_status()
+                    data = orjson.loads(await res.read())
+                    last = last_page(res)
+                    if project and isinstance(data, list):
+                        # Оставляем только нужные поля, чтобы сырые объекты сразу освобождались
+                        data = [project(item) for item in data]
+                    if res.status == 200 and "ETag" in res.headers:
+                        write_cached_response(url, res.headers["ETag"], data, last)
+                    return data, last
+        await asyncio.sleep(delay)
 
-def get_repo_issues(owner, repo):
+async def fetch_all_pages(session, semaphore, path, project=None, **params):
+    # Первая страница сообщает общее число страниц через Link: rel="last",
+    # остальные запрашиваем параллельно
+    first, last = await fetch(session, semaphore, page_url(path, 1, **params), project)
+    if not isinstance(first, list):
+        return []
+
+    rest = await asyncio.gather(*[
+        fetch(session, semaphore, page_url(path, page, **params), project)
+        for page in range(2, last + 1)
+    ])
+
+    items = list(first)
+    for data, _ in rest:
+        if isinstance(data, list):
+            items.extend(data)
+    return items
+
+def repo_fields(repo):
+    return {"name": repo["name"], "html_url": repo["html_url"]}
+
+async def get_all_repos(session, semaphore, org):
+    return await fetch_all_pages(session, semaphore, f"/orgs/{org}/repos", repo_fields)
+
+async def post_graphql(session, semaphore, query, variables):
+    for attempt in range(MAX_RETRIES + 1):
+        async with semaphore:
+            async with session.post(GRAPHQL_URL, json={"query": query, "variables": variables}) as res:
+                delay = retry_delay(res, attempt)
+                if delay is None:
+                    res.raise_for_status()
+                    data = orjson.loads(await res.read())
+                    if data.get("errors"):
+                        raise RuntimeError("; ".join(error["message"] for error in data["errors"]))
+                    return data
+        await asyncio.sleep(delay)
+
+def comment_data(comment):
+    return {
+        "author": comment["user"]["login"],
+        "created_at": comment["created_at"],
+        "body": comment["body"]
+    }
+
+async def get_issue_comments(session, semaphore, owner, repo, number):
+    return await fetch_all_pages(
+        session, semaphore, f"/repos/{owner}/{repo}/issues/{number}/comments", comment_data
+    )
+
+def gql_issue_data(node):
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "state": node["state"].lower(),
+        "author": node["author"]["login"] if node.get("author") else None,
+        "labels": [label["name"] for label in node["labels"]["nodes"]],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "closed_at": node["closedAt"],
+        "body": node["body"],
+        "url": node["url"],
+        "comments": [
+            {
+                "author": comment["author"]["login"] if comment.get("author") else None,
+                "created_at": comment["createdAt"],
+                "body": comment["body"]
+            }
+            for comment in node["comments"]["nodes"]
+        ]
+    }
+
+async def gql_fetch_issues(session, semaphore, owner, repo, since=None):
     issues = []
-    page = 1
+    overflow = []
+    variables = {"owner": owner, "name": repo, "cursor": None, "since": since}
+
     while True:
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues?per_page=100&page={page}&state=all"
-        res = requests.get(url, headers=HEADERS)
-        data = res.json()
-        if not data or "message" in data:
+        data = await post_graphql(session, semaphore, ISSUES_QUERY, variables)
+        connection = data["data"]["repository"]["issues"]
+        for node in connection["nodes"]:
+            issue_data = gql_issue_data(node)
+            issues.append(issue_data)
+            if node["comments"]["pageInfo"]["hasNextPage"]:
+                overflow.append(issue_data)
+
+        if not connection["pageInfo"]["hasNextPage"]:
             break
-        for issue in data:
-            if 'pull_request' not in issue:
-                issue_data = {
-                    "number": issue["number"],
-                    "title": issue["title"],
-                    "state": issue["state"],
-                    "author": issue["user"]["login"] if issue.get("user") else None,
-                    "labels": [label["name"] for label in issue.get("labels", [])],
-                    "created_at": issue["created_at"],
-                    "updated_at": issue["updated_at"],
-                    "closed_at": issue["closed_at"],
-                    "body": issue["body"],
-                    "url": issue["html_url"],
-                    "comments": []
-                }
-
-                # Комментарии к issue
-                comments_url = issue["comments_url"]
-                comments_res = requests.get(comments_url, headers=HEADERS)
-                comments_data = comments_res.json()
-                for comment in comments_data:
-                    issue_data["comments"].append({
-                        "author": comment["user"]["login"],
-                        "created_at": comment["created_at"],
-                        "body": comment["body"]
-                    })
-
-                issues.append(issue_data)
-        page += 1
+        variables["cursor"] = connection["pageInfo"]["endCursor"]
+
+    # Редкие issue с более чем 100 комментариями догружаем через REST
+    all_comments = await asyncio.gather(*[
+        get_issue_comments(session, semaphore, owner, repo, issue_data["number"])
+        for issue_data in overflow
+    ])
+    for issue_data, comments in zip(overflow, all_comments):
+        issue_data["comments"] = comments
+
     return issues
 
-def main():
+def merge_issues(previous_issues, new_issues):
+    merged = {issue["number"]: issue for issue in previous_issues}
+    for issue in new_issues:
+        merged[issue["number"]] = issue
+    return sorted(merged.values(), key=lambda issue: issue["number"], reverse=True)
+
+async def collect_repo(session, semaphore, repo, previous_offset, since):
+    print(f"🔍 Репозиторий: {repo['name']}")
+    issues = await gql_fetch_issues(session, semaphore, GITHUB_ORG, repo["name"], since)
+    if previous_offset is not None:
+        issues = merge_issues(read_previous_repo(previous_offset)["issues"], issues)
+
+    return {
+        "name": repo["name"],
+        "url": repo["html_url"],
+        "issues": issues
+    }
+
+async def main():
     print(f"📥 Собираем данные из GitHub: {GITHUB_ORG}")
-    repos = get_all_repos(GITHUB_ORG)
-    all_data = []
-
-    for repo in repos:
-        print(f"🔍 Репозиторий: {repo['name']}")
-        repo_data = {
-            "name": repo["name"],
-            "url": repo["html_url"],
-            "issues": get_repo_issues(GITHUB_ORG, repo["name"])
-        }
-        all_data.append(repo_data)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    load_etags()
+    previous_offsets = index_previous_data()
+    state = load_state()
+    # Один пул keep-alive соединений на весь сбор; сессия закрывается явно при выходе из async with
+    connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, keepalive_timeout=60)
+    tmp_file = OUTPUT_FILE + ".tmp"
+
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        repos = await get_all_repos(session, semaphore, GITHUB_ORG)
+
+        # Репозитории обрабатываются параллельно; общий семафор ограничивает число запросов в полёте.
+        # Каждый репозиторий пишется отдельной строкой JSON сразу по готовности и не держится в памяти
+        tasks = [
+            collect_repo(
+                session, semaphore, repo,
+                previous_offsets.get(repo["name"]),
+                state.get(repo["name"]) if repo["name"] in previous_offsets else None
+            )
+            for repo in repos
+        ]
+        with open(tmp_file, "wb") as f:
+            for task in asyncio.as_completed(tasks):
+                repo_data = await task
+                if repo_data["issues"]:
+                    state[repo_data["name"]] = max(issue["updated_at"] for issue in repo_data["issues"])
+                f.write(orjson.dumps(repo_data) + b"\n")
 
-    with open("github_data.json", "w", encoding="utf-8") as f:
-        json.dump(all_data, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_file, OUTPUT_FILE)
+    save_etags()
+    save_state(state)
 
-    print("✅ Данные сохранены в github_data.json")
+    print(f"✅ Данные сохранены в {OUTPUT_FILE}")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,102 +1,535 @@
-import json
+import orjson
 import os
-import glob
+import io
+import asyncio
+import mmap
+import functools
+from enum import Enum
 from pathlib import Path
 import anthropic
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TextIO
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from dotenv import load_dotenv
 
+import llm_cache
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+PROMPTS_DIR = Path(__file__).parent / 'prompts'
+
+class PromptMode(str, Enum):
+    FULL = "full"    # Claude returns the whole HTML document
+    INNER = "inner"  # Claude returns only the post divs, wrapped locally in _HTML_TEMPLATE
+
+_MAX_TOKENS = {
+    PromptMode.FULL: 4000,
+    PromptMode.INNER: 1500,
+}
+
+@functools.cache
+def load_prompt(mode: PromptMode) -> str:
+    # Read once per mode; the prompt files don't change while the generator runs
+    with open(PROMPTS_DIR / f"{mode.value}.txt", 'r', encoding='utf-8') as f:
+        return f.read()
+
+_HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>QF Network Social Posts</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background: #f0f2f5;
+            color: #1c1e21;
+        }
+
+        .post {
+            background: white;
+            max-width: 520px;
+            margin: 30px auto;
+            border-radius: 8px;
+            box-shadow: 0 1px 2px rgba(0,0,0,0.2);
+            overflow: hidden;
+            border: 1px solid #dadde1;
+        }
+
+        .post-header {
+            padding: 12px 16px;
+            border-bottom: 1px solid #dadde1;
+            display: flex;
+            align-items: center;
+            gap: 8px;
+        }
+
+        .profile-pic {
+            width: 40px;
+            height: 40px;
+            border-radius: 50%;
+            background: linear-gradient(135deg, #667eea, #764ba2);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-weight: bold;
+            font-size: 18px;
+        }
+
+        .post-info {
+            flex: 1;
+        }
+
+        .username {
+            font-weight: 600;
+            font-size: 15px;
+        }
+
+        .timestamp {
+            color: #65676b;
+            font-size: 13px;
+        }
+
+        .platform-badge {
+            background: #e4e6ea;
+            padding: 3px 8px;
+            border-radius: 12px;
+            font-size: 11px;
+            color: #65676b;
+        }
+
+        .post-content {
+            padding: 16px;
+        }
+
+        .post-text {
+            line-height: 1.34;
+            margin-bottom: 12px;
+        }
+
+        .post-image-container {
+            margin: 12px 0;
+            border-radius: 8px;
+            overflow: hidden;
+            cursor: pointer;
+            transition: transform 0.2s;
+        }
+
+        .post-image-container:hover {
+            transform: scale(1.02);
+        }
+
+        .code-diff {
+            background: #0d1117;
+            color: #e6edf3;
+            border-radius: 8px;
+            padding: 16px;
+            font-family: 'SF Mono', Monaco, monospace;
+            font-size: 12px;
+            line-height: 1.4;
+            position: relative;
+            overflow-x: auto;
+        }
+
+        .diff-header {
+            color: #7d8590;
+            margin-bottom: 8px;
+            font-size: 11px;
+        }
+
+        .diff-removed {
+            background: #490202;
+            color: #f85149;
+            display: block;
+            padding: 2px 4px;
+            margin: 1px 0;
+        }
+
+        .diff-added {
+            background: #0f5132;
+            color: #56d364;
+            display: block;
+            padding: 2px 4px;
+            margin: 1px 0;
+        }
+
+        .file-tree {
+            background: #f6f8fa;
+            border: 1px solid #d1d9e0;
+            border-radius: 8px;
+            padding: 16px;
+            font-family: 'SF Mono', Monaco, monospace;
+            font-size: 13px;
+            line-height: 1.6;
+        }
+
+        .folder {
+            color: #0969da;
+            font-weight: 600;
+        }
+
+        .file {
+            color: #656d76;
+            margin-left: 16px;
+        }
+
+        .file.modified {
+            color: #bf8700;
+        }
+
+        .file.added {
+            color: #1a7f37;
+        }
+
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 8px;
+            margin: 12px 0;
+        }
+
+        .stat-box {
+            background: #f0f2f5;
+            padding: 12px;
+            border-radius: 8px;
+            text-align: center;
+        }
+
+        .stat-number {
+            font-size: 20px;
+            font-weight: bold;
+            color: #1877f2;
+            margin: 0;
+        }
+
+        .stat-label {
+            font-size: 11px;
+            color: #65676b;
+            margin: 4px 0 0 0;
+        }
+
+        .commit-visual {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            text-align: center;
+            position: relative;
+            min-height: 120px;
+            display: flex;
+            flex-direction: column;
+            justify-content: center;
+        }
+
+        .commit-hash {
+            font-family: monospace;
+            background: rgba(255,255,255,0.2);
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 12px;
+            margin-bottom: 8px;
+            display: inline-block;
+        }
+
+        .commit-title {
+            font-size: 18px;
+            font-weight: bold;
+            margin: 8px 0;
+        }
+
+        .interactive-buttons {
+            display: flex;
+            gap: 8px;
+            margin-top: 12px;
+        }
+
+        .btn {
+            padding: 8px 16px;
+            border: none;
+            border-radius: 6px;
+            cursor: pointer;
+            font-size: 13px;
+            font-weight: 600;
+            transition: all 0.2s;
+        }
+
+        .btn-primary {
+            background: #1877f2;
+            color: white;
+        }
+
+        .btn-secondary {
+            background: #e4e6ea;
+            color: #1c1e21;
+        }
+
+        .btn:hover {
+            transform: translateY(-1px);
+            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+        }
+
+        .engagement-bar {
+            display: flex;
+            justify-content: space-between;
+            padding: 8px 16px;
+            border-top: 1px solid #dadde1;
+            background: #f7f8fa;
+        }
+
+        .engagement-btn {
+            background: none;
+            border: none;
+            padding: 8px 12px;
+            border-radius: 6px;
+            cursor: pointer;
+            font-size: 14px;
+            color: #65676b;
+            transition: background 0.2s;
+        }
+
+        .engagement-btn:hover {
+            background: #e4e6ea;
+        }
+
+        .hashtag {
+            color: #1877f2;
+            font-weight: 500;
+        }
+
+        .architecture-diagram {
+            background: #f8f9fa;
+            border: 2px dashed #dee2e6;
+            border-radius: 8px;
+            padding: 20px;
+            text-align: center;
+            margin: 12px 0;
+        }
+
+        .component {
+            display: inline-block;
+            background: white;
+            border: 2px solid #007bff;
+            border-radius: 8px;
+            padding: 12px 16px;
+            margin: 4px;
+            font-weight: 600;
+            color: #007bff;
+            min-width: 100px;
+        }
+
+        .arrow {
+            font-size: 24px;
+            color: #007bff;
+            margin: 0 8px;
+        }
+
+        .progress-visual {
+            background: linear-gradient(90deg, #e9ecef 0%, #e9ecef 60%, #28a745 60%, #28a745 100%);
+            height: 8px;
+            border-radius: 4px;
+            margin: 8px 0;
+            position: relative;
+        }
+
+        .progress-text {
+            position: absolute;
+            top: -20px;
+            right: 0;
+            font-size: 12px;
+            font-weight: bold;
+            color: #28a745;
+        }
+
+        @keyframes slideIn {
+            from { opacity: 0; transform: translateY(20px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
+
+        .post {
+            animation: slideIn 0.5s ease-out;
+        }
+
+        .clickable {
+            cursor: pointer;
+            transition: all 0.2s;
+        }
+
+        .clickable:hover {
+            background: #f0f2f5;
+        }
+    </style>
+</head>
+<body>
+
+{POSTS_CONTENT}
+
+    <script>
+        document.querySelectorAll('.btn').forEach(btn => {
+            btn.addEventListener('click', function() {
+                this.style.transform = 'scale(0.95)';
+                setTimeout(() => {
+                    this.style.transform = '';
+                }, 100);
+            });
+        });
+
+        document.querySelectorAll('.post-image-container').forEach(container => {
+            container.addEventListener('click', function() {
+                this.style.transform = 'scale(1.05)';
+                setTimeout(() => {
+                    this.style.transform = '';
+                }, 200);
+            });
+        });
+    </script>
+</body>
+</html>'''
+
+_TEMPLATE_PREFIX, _TEMPLATE_SUFFIX = _HTML_TEMPLATE.split('{POSTS_CONTENT}')
+
 class GitHubPostsGenerator:
     def __init__(self):
         self.api_key = os.getenv('CLAUDE_API_KEY')
         if not self.api_key:
             raise ValueError("CLAUDE_API_KEY not found in environment variables")
         
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = anthropic.AsyncAnthropic(api_key=self.api_key, max_retries=3)
         self.model = os.getenv('CLAUDE_MODEL', 'claude-3-5-sonnet-20241022')
         self.issues_file = os.getenv('ISSUES_FILE_PATH', 'issues/github_cases.json')
         self.commits_folder = os.getenv('COMMITS_FOLDER_PATH', 'commits')
         self.output_folder = os.getenv('OUTPUT_FOLDER_PATH', 'generated_posts')
+        # Commits are sent in chunks so each request stays well inside the context window
+        self.chunk_size = int(os.getenv('POSTS_CHUNK_SIZE', 8))
+        self.max_concurrency = int(os.getenv('CLAUDE_MAX_CONCURRENCY', 5))
         
-    def load_github_issues(self) -> Dict[str, Any]:
+    def load_github_issues(self) -> List[Dict[str, Any]]:
         try:
-            with open(self.issues_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data
+            with open(self.issues_file, 'rb') as f:
+                # collect_issuess.py writes one repository per line
+                if self.issues_file.endswith('.jsonl'):
+                    return [orjson.loads(line) for line in f if line.strip()]
+                # Older runs wrote a single JSON array of repositories
+                data = orjson.loads(f.read())
+                return data if isinstance(data, list) else []
         except Exception as e:
             logger.error(f"Error loading issues: {e}")
-            return {}
+            return []
+    
+    def _read_commit_file(self, entry: os.DirEntry) -> Optional[Dict[str, str]]:
+        try:
+            with open(entry.path, 'rb') as f:
+                # mmap cannot map an empty file
+                if entry.stat().st_size == 0:
+                    content = ''
+                else:
+                    # Decode straight from the mapped pages instead of an intermediate read() buffer
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, 'utf-8')
+            return {
+                'filename': entry.name,
+                'content': content
+            }
+        except Exception as e:
+            logger.error(f"Error reading file {entry.path}: {e}")
+            return None
     
     def load_commit_files(self) -> List[Dict[str, str]]:
-        commits_data = []
-        md_files = glob.glob(os.path.join(self.commits_folder, '*.md'))
-        
-        for file_path in md_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    commits_data.append({
-                        'filename': os.path.basename(file_path),
-                        'content': content
-                    })
-            except Exception as e:
-                logger.error(f"Error reading file {file_path}: {e}")
-        
-        return commits_data
+        try:
+            with os.scandir(self.commits_folder) as it:
+                md_files = [entry for entry in it if entry.name.endswith('.md') and entry.is_file()]
+        except FileNotFoundError:
+            logger.error(f"Commits folder not found: {self.commits_folder}")
+            return []
+        
+        # Reads are I/O-bound, so threads overlap the per-file open/read latency
+        with ThreadPoolExecutor(max_workers=min(32, len(md_files) or 1)) as executor:
+            results = executor.map(self._read_commit_file, md_files)
+            return [commit for commit in results if commit is not None]
+    
+    def _compact_issues(self, issues_data: List[Dict[str, Any]]) -> str:
+        # Only the fields the posts use, serialized without whitespace to save prompt tokens
+        compact = [
+            {
+                "repo": repo["name"],
+                "issues": [
+                    {"n": issue["number"], "t": issue["title"], "s": issue["state"], "body": (issue["body"] or "")[:400]}
+                    for issue in repo["issues"][:10]
+                ]
+            }
+            for repo in issues_data
+        ]
+        return orjson.dumps(compact).decode('utf-8')
     
-    def prepare_data_for_claude(self, issues_data: Dict[str, Any], commits_data: List[Dict[str, str]]) -> str:
-        formatted_data = "# GitHub Data for Post Generation\n\n"
+    def prepare_data_for_claude(self, issues_data: List[Dict[str, Any]], commits_data: List[Dict[str, str]]) -> str:
+        # Writing into one buffer keeps this linear in the total size of the commit files
+        buf = io.StringIO()
+        buf.write("# GitHub Data for Post Generation\n\n")
         
-        formatted_data += "## GitHub Issues Data:\n"
-        formatted_data += f"```json\n{json.dumps(issues_data, indent=2, ensure_ascii=False)}\n```\n\n"
+        buf.write("## GitHub Issues Data:\n")
+        buf.write(f"```json\n{self._compact_issues(issues_data)}\n```\n\n")
         
-        formatted_data += "## Commits Data:\n\n"
+        buf.write("## Commits Data:\n\n")
         for commit in commits_data:
-            formatted_data += f"### File: {commit['filename']}\n"
-            formatted_data += f"```markdown\n{commit['content']}\n```\n\n"
+            buf.write(f"### File: {commit['filename']}\n```markdown\n")
+            buf.write(commit['content'])
+            buf.write("\n```\n\n")
         
-        return formatted_data
+        return buf.getvalue()
     
-    def generate_post_with_claude(self, data: str) -> str:
-        prompt = f"""
-RETURN ONLY HTML CODE. NO COMMENTS.
-
-Create posts using EXACT same CSS and structure. Copy ALL styles from example without changes.
-
-CRITICAL RULES:
-1. Username: ALWAYS "Quantum Fusion" 
-2. NO numbers in engagement buttons (just "👍 Like", "💬 Comment", "🔄 Share")
-3. Copy CSS exactly - no style modifications
-4. Include full visual elements: code diffs, stats, progress bars
-5. Make technical content simple for users
-
-Data:
-{data}
-
-Return complete HTML document starting with <!DOCTYPE html>
-"""
+    def get_html_template(self) -> str:
+        return _HTML_TEMPLATE
+    
+    async def generate_post_with_claude(self, data: str, out: TextIO, mode: PromptMode = PromptMode.INNER) -> str:
+        static_prompt = load_prompt(mode)
+        data_prompt = f"Data:\n{data}\n"
+        if mode is PromptMode.INNER:
+            prefix, suffix = _TEMPLATE_PREFIX, _TEMPLATE_SUFFIX
+        else:
+            prefix, suffix = "", ""
+        
+        cached = llm_cache.get(self.model, static_prompt + data_prompt)
+        if cached is not None:
+            html = prefix + cached + suffix
+            out.write(html)
+            return html
         
+        # Page prefix goes out before the first token; the suffix closes the page once the stream ends
+        out.write(prefix)
         try:
-            response = self.client.messages.create(
+            chunks = []
+            async with self.client.messages.stream(
                 model=self.model,
-                max_tokens=4000,
+                max_tokens=_MAX_TOKENS[mode],
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "text", "text": static_prompt},
+                            {"type": "text", "text": data_prompt}
+                        ]
+                    }
                 ]
-            )
+            ) as stream:
+                async for text in stream.text_stream:
+                    out.write(text)
+                    chunks.append(text)
             
-            return response.content[0].text
+            content = "".join(chunks)
+            llm_cache.put(self.model, static_prompt + data_prompt, content)
+            out.write(suffix)
+            return prefix + content + suffix
         except Exception as e:
             logger.error(f"Error generating post with Claude: {e}")
-            return f"Error generating post: {e}"
+            error_message = f"Error generating post: {e}"
+            out.write(error_message + suffix)
+            return error_message
     
-    def save_generated_post(self, content: str, filename: str = None) -> str:
+    def get_output_path(self, filename: str = None) -> str:
         os.makedirs(self.output_folder, exist_ok=True)
         
         if not filename:
@@ -107,7 +540,10 @@ Return complete HTML document starting with <!DOCTYPE html>
         if not filename.endswith('.html'):
             filename += '.html'
         
-        file_path = os.path.join(self.output_folder, filename)
+        return os.path.join(self.output_folder, filename)
+    
+    def save_generated_post(self, content: str, filename: str = None) -> str:
+        file_path = self.get_output_path(filename)
         
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
@@ -118,8 +554,21 @@ Return complete HTML document starting with <!DOCTYPE html>
             logger.error(f"Error saving post to {file_path}: {e}")
             return ""
     
-    def generate_posts(self) -> List[str]:
-        logger.info("Starting post generation process...")
+    async def stream_generated_post(self, data: str, mode: PromptMode, filename: str = None) -> str:
+        file_path = self.get_output_path(filename)
+        
+        try:
+            # The file is opened up front so Claude's output lands on disk as it is generated
+            with open(file_path, 'w', encoding='utf-8') as f:
+                await self.generate_post_with_claude(data, f, mode)
+            logger.info(f"Post saved to: {file_path}")
+            return file_path
+        except Exception as e:
+            logger.error(f"Error saving post to {file_path}: {e}")
+            return ""
+    
+    async def generate(self, mode: PromptMode = PromptMode.INNER) -> List[str]:
+        logger.info(f"Starting post generation process ({mode.value} mode)...")
         
         issues_data = self.load_github_issues()
         commits_data = self.load_commit_files()
@@ -128,21 +577,38 @@ Return complete HTML document starting with <!DOCTYPE html>
             logger.warning("No data loaded, cannot generate posts")
             return []
         
-        formatted_data = self.prepare_data_for_claude(issues_data, commits_data)
-        generated_content = self.generate_post_with_claude(formatted_data)
-        saved_file = self.save_generated_post(generated_content)
+        chunks = [
+            commits_data[i:i + self.chunk_size]
+            for i in range(0, len(commits_data), self.chunk_size)
+        ] or [[]]
+        logger.info(f"Generating {len(chunks)} post file(s) from {len(commits_data)} commit files")
+        
+        from datetime import datetime
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def generate_chunk(index: int, chunk: List[Dict[str, str]]) -> str:
+            formatted_data = self.prepare_data_for_claude(issues_data, chunk)
+            async with semaphore:
+                return await self.stream_generated_post(
+                    formatted_data, mode, f"generated_post_{timestamp}_{index + 1}.html"
+                )
         
-        if saved_file:
+        # Chunks are generated concurrently, one output file each
+        results = await asyncio.gather(*[generate_chunk(i, chunk) for i, chunk in enumerate(chunks)])
+        saved_files = [file_path for file_path in results if file_path]
+        
+        if saved_files:
             logger.info("Post generation completed successfully")
-            return [saved_file]
         else:
             logger.error("Failed to save generated post")
-            return []
+        return saved_files
 
 def main():
     try:
         generator = GitHubPostsGenerator()
-        generated_files = generator.generate_posts()
+        mode = PromptMode(os.getenv('POSTS_PROMPT_MODE', PromptMode.INNER.value))
+        generated_files = asyncio.run(generator.generate(mode))
         
         if generated_files:
             print("Generated posts:")
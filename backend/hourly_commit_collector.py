@@ -1,12 +1,20 @@
-import requests
-import pandas as pd
+import httpx
+import asyncio
 import datetime
 import time
 import os
+import orjson
+import hashlib
+import logging
 from dotenv import load_dotenv
 import argparse
+import csv
+from collections import defaultdict
 from pathlib import Path
 
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
 # ----------------------
 # Step 1: Load Environment Variables
 # ----------------------
@@ -32,15 +40,181 @@ def load_environment():
 # Step 2: GitHub API Functions
 # ----------------------
 
-def safe_get(url, headers=None, params=None):
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# One query per page of branches returns every branch together with its commits in the time range
+BRANCH_COMMITS_QUERY = """
+query($owner: String!, $name: String!, $refsCursor: String, $since: GitTimestamp, $until: GitTimestamp) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $refsCursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        target {
+          ... on Commit {
+            history(first: 100, since: $since, until: $until) {
+              pageInfo { hasNextPage endCursor }
+              nodes { ...CommitFields }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+fragment CommitFields on Commit {
+  oid message additions deletions changedFilesIfAvailable
+  author { name date user { login } }
+}
+"""
+
+# Follow-up pages for branches with more than 100 commits in the time range
+BRANCH_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $branch: String!, $cursor: String, $since: GitTimestamp, $until: GitTimestamp) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $branch) {
+      target {
+        ... on Commit {
+          history(first: 100, after: $cursor, since: $since, until: $until) {
+            pageInfo { hasNextPage endCursor }
+            nodes { ...CommitFields }
+          }
+        }
+      }
+    }
+  }
+}
+fragment CommitFields on Commit {
+  oid message additions deletions changedFilesIfAvailable
+  author { name date user { login } }
+}
+"""
+
+# Number of GitHub requests in flight at once
+GH_CONCURRENCY = int(os.getenv("GH_CONCURRENCY", "16"))
+
+# Commit details keyed by SHA; commits are immutable, so entries never go stale
+COMMIT_CACHE_DIR = Path(os.getenv("COMMIT_CACHE_DIR", ".commit_cache"))
+
+def read_cached_details(sha):
+    path = COMMIT_CACHE_DIR / f"{sha}.json"
+    if path.exists():
+        return orjson.loads(path.read_bytes())
+    return None
+
+def write_cached_details(sha, details):
+    COMMIT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = COMMIT_CACHE_DIR / f"{sha}.json"
+    tmp_path = path.with_suffix(".tmp")
+    # Write to a temp file first so an interrupted run never leaves a truncated entry
+    tmp_path.write_bytes(orjson.dumps(details))
+    os.replace(tmp_path, path)
+
+def create_client(token):
+    """Create the shared HTTP/2 client; concurrent requests multiplex over one connection to api.github.com."""
+    return httpx.AsyncClient(
+        http2=True,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=httpx.Limits(max_connections=50),
+        timeout=30.0
+    )
+
+# Conditional GET cache for listing endpoints; a 304 reply does not count against the rate limit
+HTTP_CACHE_DIR = Path(os.getenv("GITHUB_CACHE_DIR", ".github_cache")) / "hourly"
+
+def cached_response_path(url):
+    return HTTP_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+def read_cached_response(url):
+    path = cached_response_path(url)
+    if path.exists():
+        return orjson.loads(path.read_bytes())
+    return None
+
+def write_cached_response(url, response):
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # The Link header is kept with the body so a 304 can still be paginated
+    cached = {
+        "etag": response.headers["ETag"],
+        "link": response.headers.get("Link"),
+        "body": response.text
+    }
+    cached_response_path(url).write_bytes(orjson.dumps(cached))
+
+class Budget:
+    """
+    Preflight throttle for one GitHub rate-limit resource.
+    Tracks X-RateLimit-Remaining / X-RateLimit-Reset from responses and, once the
+    budget drops to MIN_BUFFER, holds every new request until the window resets
+    instead of letting concurrent requests all run into a 403.
+    """
+    MIN_BUFFER = int(os.getenv("GH_RATE_LIMIT_BUFFER", "20"))
+    
+    def __init__(self):
+        self.remaining = None  # Unknown until the first response
+        self.reset = 0
+        self.lock = None
+    
+    async def acquire(self):
+        # Created lazily so the lock belongs to the running event loop
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        
+        async with self.lock:
+            if self.remaining is not None and self.remaining <= self.MIN_BUFFER:
+                sleep_time = max(self.reset - time.time(), 0) + 1
+                print(f"Rate limit budget low ({self.remaining} left). Sleeping for {sleep_time:.0f} seconds.")
+                await asyncio.sleep(sleep_time)
+                self.remaining = None
+            elif self.remaining is not None:
+                self.remaining -= 1
+    
+    def update(self, response):
+        if "X-RateLimit-Remaining" not in response.headers:
+            return
+        remaining = int(response.headers["X-RateLimit-Remaining"])
+        reset = int(response.headers.get("X-RateLimit-Reset", 0))
+        # Responses arrive out of order; within one window keep the lowest count seen
+        if self.remaining is None or reset > self.reset:
+            self.remaining = remaining
+        else:
+            self.remaining = min(self.remaining, remaining)
+        self.reset = max(self.reset, reset)
+
+# REST and GraphQL have separate rate limits
+REST_BUDGET = Budget()
+GRAPHQL_BUDGET = Budget()
+
+def raise_for_error(response):
+    """Log a failed response, decoding at most the first 500 bytes of the body, and raise."""
+    print(f"Error: {response.status_code} - {response.content[:500].decode('utf-8', 'replace')}")
+    response.raise_for_status()
+
+async def safe_get(client, semaphore, url, params=None, conditional=False):
     """
     Makes a GET request and checks for rate limit issues.
     If the rate limit is exceeded, it sleeps until the reset time.
+    With conditional=True the request carries the cached ETag and a 304
+    is answered from the cached body.
     """
+    cached = read_cached_response(url) if conditional and not params else None
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    
     while True:
-        response = requests.get(url, headers=headers, params=params)
+        await REST_BUDGET.acquire()
+        async with semaphore:
+            response = await client.get(url, params=params, headers=headers)
+        REST_BUDGET.update(response)
         
-        # Check for rate limit
+        if response.status_code == 304:
+            return httpx.Response(
+                200,
+                headers={"Link": cached["link"]} if cached["link"] else None,
+                content=cached["body"].encode("utf-8"),
+                request=response.request
+            )
+        
+        # Fallback for limits the preflight budget cannot see (e.g. a token shared with other jobs)
         if response.status_code == 403:
             if 'X-RateLimit-Remaining' in response.headers:
                 remaining = int(response.headers['X-RateLimit-Remaining'])
@@ -48,95 +222,103 @@ def safe_get(url, headers=None, params=None):
                     reset_time = int(response.headers.get('X-RateLimit-Reset', time.time() + 60))
                     sleep_time = max(reset_time - time.time(), 0) + 5
                     print(f"Rate limit reached. Sleeping for {sleep_time:.0f} seconds.")
-                    time.sleep(sleep_time)
+                    await asyncio.sleep(sleep_time)
                     continue
         
         if response.status_code != 200:
-            print(f"Error: {response.status_code} - {response.text}")
-            response.raise_for_status()
+            raise_for_error(response)
+        
+        if conditional and not params and "ETag" in response.headers:
+            write_cached_response(url, response)
         
         return response
 
-def get_org_members(org, token):
+def next_url(response):
+    """Return the rel="next" URL from the Link header, or None on the last page."""
+    return response.links.get("next", {}).get("url")
+
+async def get_org_members(client, semaphore, org):
     """Fetch all members for the given organization."""
     members = set()
     url = f"https://api.github.com/orgs/{org}/members?per_page=100"
-    headers = {"Authorization": f"token {token}"}
     
     while url:
-        response = safe_get(url, headers=headers)
-        data = response.json()
+        response = await safe_get(client, semaphore, url, conditional=True)
+        data = orjson.loads(response.content)
+        if not data:
+            break
         
         for member in data:
             members.add(member.get("login"))
         
-        # Handle pagination
-        if 'Link' in response.headers:
-            links = response.headers['Link']
-            next_url = None
-            for link in links.split(','):
-                if 'rel="next"' in link:
-                    next_url = link[link.find("<")+1:link.find(">")]
-                    break
-            url = next_url
-        else:
-            url = None
+        url = next_url(response)
     
     return members
 
-def fetch_repositories(org, token):
+# Membership changes rarely, so the member list is reused between hourly runs
+MEMBERS_CACHE_TTL = int(os.getenv("MEMBERS_CACHE_TTL", "86400"))
+
+async def get_org_members_cached(client, semaphore, org, ttl=MEMBERS_CACHE_TTL):
+    """Return org members from the on-disk cache, refetching once it is older than ttl seconds."""
+    path = HTTP_CACHE_DIR / f"members_{org}.json"
+    if path.exists() and time.time() - path.stat().st_mtime < ttl:
+        return set(orjson.loads(path.read_bytes()))
+    
+    # After expiry the listing pages are still revalidated with their ETags
+    members = await get_org_members(client, semaphore, org)
+    HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(sorted(members)))
+    return members
+
+async def fetch_repositories(client, semaphore, org):
     """Fetch all repositories for the given organization."""
     repos = []
     url = f"https://api.github.com/orgs/{org}/repos?per_page=100"
-    headers = {"Authorization": f"token {token}"}
     
     while url:
-        response = safe_get(url, headers=headers)
-        data = response.json()
+        response = await safe_get(client, semaphore, url, conditional=True)
+        data = orjson.loads(response.content)
+        if not data:
+            break
         
         for repo in data:
             repos.append(repo["name"])
         
-        # Handle pagination
-        if 'Link' in response.headers:
-            links = response.headers['Link']
-            next_url = None
-            for link in links.split(','):
-                if 'rel="next"' in link:
-                    next_url = link[link.find("<")+1:link.find(">")]
-                    break
-            url = next_url
-        else:
-            url = None
+        url = next_url(response)
     
     return repos
 
-def fetch_branches(org, repo, token):
-    """Fetch the list of branches for a given repository."""
-    branches = []
-    url = f"https://api.github.com/repos/{org}/{repo}/branches?per_page=100"
-    headers = {"Authorization": f"token {token}"}
+async def graphql_query(client, semaphore, query, variables):
+    """Run a GraphQL query and return its data, raising on HTTP or GraphQL errors."""
+    await GRAPHQL_BUDGET.acquire()
+    async with semaphore:
+        response = await client.post(
+            GRAPHQL_URL,
+            content=orjson.dumps({"query": query, "variables": variables}),
+            headers={"Content-Type": "application/json"}
+        )
+    GRAPHQL_BUDGET.update(response)
     
-    try:
-        response = safe_get(url, headers=headers)
-        data = response.json()
-        
-        for branch in data:
-            branches.append(branch["name"])
-    except Exception as e:
-        print(f"Error fetching branches for {repo}: {e}")
+    if response.status_code != 200:
+        raise_for_error(response)
     
-    return branches
+    data = orjson.loads(response.content)
+    if data.get("errors"):
+        raise Exception("; ".join(error["message"] for error in data["errors"]))
+    
+    return data["data"]
 
-def fetch_commit_details(org, repo, sha, token):
+async def fetch_commit_details(client, semaphore, org, repo, sha):
     """Fetch detailed commit information including diff."""
+    cached = read_cached_details(sha)
+    if cached is not None:
+        return cached
+    
     url = f"https://api.github.com/repos/{org}/{repo}/commits/{sha}"
-    headers = {"Authorization": f"token {token}"}
     
     try:
-        response = safe_get(url, headers=headers)
-        data = response.json()
-        
+        response = await safe_get(client, semaphore, url)
+        data = orjson.loads(response.content)
         stats = data.get("stats", {})
         files = data.get("files", [])
         
@@ -152,7 +334,7 @@ def fetch_commit_details(org, repo, sha, token):
                 "patch": file_info.get("patch", "")  # actual diff
             })
         
-        return {
+        details = {
             "stats": {
                 "total_additions": stats.get("additions", 0),
                 "total_deletions": stats.get("deletions", 0),
@@ -161,122 +343,142 @@ def fetch_commit_details(org, repo, sha, token):
             "files": file_changes,
             "files_changed": len(files)
         }
+        write_cached_details(sha, details)
+        return details
         
     except Exception as e:
         print(f"Error fetching details for commit {sha}: {e}")
         return None
 
-def fetch_commits_for_branch(org, repo, branch, token, since=None, until=None, org_members=None, include_details=True):
-    """Fetch commit data for a given branch within the date range."""
+def build_commit_info(org, repo, branch, node):
+    """Convert a GraphQL commit node into the commit dict used by the reports."""
+    author_data = node.get("author") or {}
+    user = author_data.get("user") or {}
+    sha = node["oid"]
+    additions = node.get("additions", 0)
+    deletions = node.get("deletions", 0)
+    
+    return {
+        "repo": repo,
+        "branch": branch,
+        "sha": sha,
+        "message": node.get("message", ""),
+        "author": author_data.get("name", "Unknown"),
+        "author_login": user.get("login", "Unknown"),
+        "date": author_data.get("date"),
+        "commit_link": f"https://github.com/{org}/{repo}/commit/{sha}",
+        "stats": {
+            "total_additions": additions,
+            "total_deletions": deletions,
+            "total_changes": additions + deletions
+        },
+        "files_changed": node.get("changedFilesIfAvailable") or 0
+    }
+
+async def fetch_repo_commits_graphql(client, semaphore, org, repo, since=None, until=None, org_members=None):
+    """Fetch commits of every branch of a repository within the date range via GraphQL."""
     commits = []
-    url = f"https://api.github.com/repos/{org}/{repo}/commits"
-    headers = {"Authorization": f"token {token}"}
-    params = {"sha": branch, "per_page": 100}
+    variables = {"owner": org, "name": repo, "refsCursor": None, "since": since, "until": until}
+    
+    def collect(branch, history):
+        for node in history["nodes"]:
+            # Filter by org members if specified
+            if org_members is not None:
+                user = (node.get("author") or {}).get("user") or {}
+                if user.get("login") not in org_members:
+                    continue
+            commits.append(build_commit_info(org, repo, branch, node))
     
-    if since:
-        params["since"] = since
-    if until:
-        params["until"] = until
-
-    while url:
-        try:
-            response = safe_get(url, headers=headers, params=params)
-            data = response.json()
-            
-            if not isinstance(data, list):
-                break
-            
-            for commit in data:
-                author_obj = commit.get("author")
-                
-                # Filter by org members if specified
-                if org_members is not None:
-                    if not author_obj or author_obj.get("login") not in org_members:
-                        continue
-                
-                sha = commit.get("sha")
-                commit_data = commit.get("commit", {})
-                author_data = commit_data.get("author", {})
-                
-                commit_info = {
-                    "repo": repo,
-                    "branch": branch,
-                    "sha": sha,
-                    "message": commit_data.get("message", ""),
-                    "author": author_data.get("name", "Unknown"),
-                    "author_login": author_obj.get("login") if author_obj else "Unknown",
-                    "date": author_data.get("date"),
-                    "commit_link": f"https://github.com/{org}/{repo}/commit/{sha}"
-                }
-                
-                # Fetch detailed information if requested
-                if include_details:
-                    print(f"      Fetching details for commit {sha[:8]}...")
-                    details = fetch_commit_details(org, repo, sha, token)
-                    if details:
-                        commit_info.update(details)
-                
-                commits.append(commit_info)
+    # Errors propagate: the caller marks the repository as failed instead of keeping a truncated list
+    while True:
+        refs = (await graphql_query(client, semaphore, BRANCH_COMMITS_QUERY, variables))["repository"]["refs"]
+        
+        for ref in refs["nodes"]:
+            branch = ref["name"]
+            history = (ref.get("target") or {}).get("history")
+            if not history:
+                continue
+            collect(branch, history)
             
-            # Handle pagination
-            if 'Link' in response.headers:
-                links = response.headers['Link']
-                next_url = None
-                for link in links.split(','):
-                    if 'rel="next"' in link:
-                        next_url = link[link.find("<")+1:link.find(">")]
-                        break
-                url = next_url
-                params = {}
-            else:
-                break
-                
-        except Exception as e:
-            print(f"Error fetching commits for {repo}/{branch}: {e}")
+            # Page through the rest of this branch's history
+            while history["pageInfo"]["hasNextPage"]:
+                data = await graphql_query(client, semaphore, BRANCH_HISTORY_QUERY, {
+                    "owner": org, "name": repo, "branch": branch,
+                    "cursor": history["pageInfo"]["endCursor"], "since": since, "until": until
+                })
+                history = data["repository"]["ref"]["target"]["history"]
+                collect(branch, history)
+        
+        if not refs["pageInfo"]["hasNextPage"]:
             break
+        variables["refsCursor"] = refs["pageInfo"]["endCursor"]
     
     return commits
 
-def fetch_all_commits(org, token, since=None, until=None, include_all_users=False, include_details=True):
-    """Fetch commits for all repositories in the organization."""
+async def attach_commit_details(client, semaphore, org, commits):
+    """Fetch file patches for the commits that do not have them yet and merge them in place."""
+    missing = [commit for commit in commits if "files" not in commit]
+    print(f"\nFetching details for {len(missing)} commits...")
+    all_details = await asyncio.gather(*[
+        fetch_commit_details(client, semaphore, org, commit["repo"], commit["sha"])
+        for commit in missing
+    ])
+    for commit, details in zip(missing, all_details):
+        if details:
+            commit.update(details)
+
+async def fetch_all_commits(org, token, since=None, until=None, include_all_users=False, include_details=False):
+    """Fetch commits for all repositories in the organization; returns (commits, failed_repos)."""
     unique_commits_dict = {}
+    failed_repos = []
     commit_branches = {}
+    semaphore = asyncio.Semaphore(GH_CONCURRENCY)
 
-    # Get organization members
-    org_members = None
-    if not include_all_users:
-        org_members = get_org_members(org, token)
-        print(f"Organization members found: {len(org_members)}")
-
-    # Get repositories
-    repos = fetch_repositories(org, token)
-    print(f"Found {len(repos)} repositories: {repos}")
-
-    for repo in repos:
-        print(f"\nProcessing repository: {repo}")
-        branches = fetch_branches(org, repo, token)
-        print(f"  Found {len(branches)} branches: {branches}")
-
-        for branch in branches:
-            print(f"    Processing branch: {branch}")
-            branch_commits = fetch_commits_for_branch(
-                org, repo, branch, token, since, until, org_members, include_details
-            )
-            print(f"      Found {len(branch_commits)} commits")
+    async with create_client(token) as client:
+        # Get organization members
+        org_members = None
+        if not include_all_users:
+            org_members = await get_org_members_cached(client, semaphore, org)
+            print(f"Organization members found: {len(org_members)}")
+
+        # Get repositories
+        repos = await fetch_repositories(client, semaphore, org)
+        print(f"Found {len(repos)} repositories: {repos}")
+
+        # Repositories are fetched concurrently; the semaphore caps requests in flight
+        all_repo_commits = await asyncio.gather(*[
+            fetch_repo_commits_graphql(client, semaphore, org, repo, since, until, org_members)
+            for repo in repos
+        ], return_exceptions=True)
+
+        for repo, repo_commits in zip(repos, all_repo_commits):
+            if isinstance(repo_commits, BaseException):
+                if not isinstance(repo_commits, Exception):
+                    raise repo_commits
+                logger.error(f"Error fetching commits for {repo}: {repo_commits}")
+                failed_repos.append(repo)
+                continue
+
+            print(f"\nProcessing repository: {repo}")
+            print(f"  Found {len(repo_commits)} commits across branches")
 
             # Process commits and track unique ones
-            for commit in branch_commits:
+            for commit in repo_commits:
                 sha = commit["sha"]
 
                 # Track branches for each commit
                 if sha not in commit_branches:
                     commit_branches[sha] = []
-                commit_branches[sha].append(branch)
+                commit_branches[sha].append(commit["branch"])
 
                 # Only add if we haven't seen this commit before
                 if sha not in unique_commits_dict:
                     unique_commits_dict[sha] = commit
 
+        # Fetch file patches once per unique commit, not once per branch it appears in
+        if include_details:
+            await attach_commit_details(client, semaphore, org, list(unique_commits_dict.values()))
+
     # Add branch information to commits
     all_unique_commits = list(unique_commits_dict.values())
     for commit in all_unique_commits:
@@ -284,35 +486,66 @@ def fetch_all_commits(org, token, since=None, until=None, include_all_users=Fals
 
     print(f"\nTotal unique commits: {len(all_unique_commits)}")
     print(f"Commits in multiple branches: {sum(1 for sha, branches in commit_branches.items() if len(branches) > 1)}")
+    if failed_repos:
+        logger.warning(f"Incomplete collection, failed repositories: {', '.join(failed_repos)}")
 
-    return all_unique_commits
+    return all_unique_commits, failed_repos
 
 # ----------------------
 # Step 3: Report Generation
 # ----------------------
 
-def generate_summary(df, org, start_time, end_time):
+# Columns of the hourly CSV; nested stats are flattened and file patches are left out
+CSV_FIELDS = [
+    "repo", "branch", "sha", "message", "author", "author_login", "date", "commit_link",
+    "files_changed", "appears_in_branches", "total_additions", "total_deletions", "total_changes"
+]
+
+def parse_date(value):
+    """Parse a GitHub ISO 8601 timestamp, which may use a trailing Z for UTC."""
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+def summarize_stats(commits):
+    """Sum additions, deletions, changes and files changed over all commits in one pass."""
+    total_additions = total_deletions = total_changes = total_files = 0
+    for commit in commits:
+        stats = commit.get("stats") or {}
+        total_additions += stats.get("total_additions", 0)
+        total_deletions += stats.get("total_deletions", 0)
+        total_changes += stats.get("total_changes", 0)
+        total_files += commit.get("files_changed", 0)
+    return total_additions, total_deletions, total_changes, total_files
+
+def generate_summary(commits, org, start_time, end_time, failed_repos=()):
     """Generate a Markdown summary of the commit data."""
-    if df.empty:
-        return f"No commits found for {org} in the last hour ({start_time} - {end_time})."
-    
-    total_commits = len(df)
-    summary_lines = [f"# Hourly GitHub Activity Report for {org}"]
-    summary_lines.append(f"**Time Range:** {start_time} - {end_time}")
-    summary_lines.append(f"**Total Commits:** {total_commits} (unique)")
-    summary_lines.append("")
+    # Failed repositories are called out so a partial report is never mistaken for a complete one
+    incomplete = [f"**Incomplete:** commits could not be fetched for {', '.join(failed_repos)}\n"] if failed_repos else []
+    if not commits:
+        return "\n".join([f"No commits found for {org} in the last hour ({start_time} - {end_time}).", *incomplete])
+    
+    total_commits = len(commits)
+    total_additions, total_deletions, total_changes, total_files = summarize_stats(commits)
+    summary_lines = [
+        f"# Hourly GitHub Activity Report for {org}\n"
+        f"**Time Range:** {start_time} - {end_time}\n"
+        f"**Total Commits:** {total_commits} (unique)\n"
+        f"**Lines Changed:** +{total_additions} -{total_deletions} ({total_changes} total) in {total_files} files\n",
+        *incomplete
+    ]
     
     # Group by repository and author
-    grouped = df.groupby(["repo", "author"])
+    grouped = defaultdict(list)
+    for commit in commits:
+        grouped[(commit["repo"], commit["author"])].append(commit)
     
     current_repo = None
-    for (repo, author), group_df in grouped:
+    for (repo, author), group in sorted(grouped.items(), key=lambda item: item[0]):
         if repo != current_repo:
             summary_lines.append(f"## Repository: [{repo}](https://github.com/{org}/{repo})")
             current_repo = repo
         
-        commit_count = len(group_df)
-        commit_links = group_df["commit_link"].unique().tolist()
+        commit_count = len(group)
+        commit_links = list(dict.fromkeys(commit["commit_link"] for commit in group))
         
         # Create numbered links (limit to 5)
         commit_links_md = ", ".join([f"[{i+1}]({link})" for i, link in enumerate(commit_links[:5])])
@@ -323,6 +556,13 @@ def generate_summary(df, org, start_time, end_time):
     
     return "\n".join(summary_lines)
 
+STATUS_EMOJI = {
+    "added": "🆕",
+    "modified": "✏️", 
+    "deleted": "🗑️",
+    "renamed": "🔄"
+}
+
 def save_commit_details(commit, org, output_dir="reports"):
     """Save individual commit details to a separate file."""
     if not commit.get("files"):
@@ -333,69 +573,76 @@ def save_commit_details(commit, org, output_dir="reports"):
     os.makedirs(commits_dir, exist_ok=True)
     
     # Create filename: repo_sha_date.md
-    date_str = pd.to_datetime(commit["date"]).strftime("%Y%m%d_%H%M%S")
+    date_str = parse_date(commit["date"]).strftime("%Y%m%d_%H%M%S")
     filename = f"{commit['repo']}_{commit['sha'][:8]}_{date_str}.md"
     filepath = os.path.join(commits_dir, filename)
     
     # Generate commit report
-    content = []
-    content.append(f"# Commit Details: {commit['sha'][:8]}")
-    content.append(f"")
-    content.append(f"**Repository:** [{commit['repo']}](https://github.com/{org}/{commit['repo']})")
-    content.append(f"**Author:** {commit['author']} ({commit['author_login']})")
-    content.append(f"**Date:** {commit['date']}")
-    content.append(f"**Branch(es):** {commit['appears_in_branches']}")
-    content.append(f"**Commit Link:** [View on GitHub]({commit['commit_link']})")
-    content.append(f"")
-    content.append(f"## Commit Message")
-    content.append(f"```")
-    content.append(commit['message'])
-    content.append(f"```")
-    content.append(f"")
+    sha8 = commit['sha'][:8]
+    header = f"""# Commit Details: {sha8}
+
+**Repository:** [{commit['repo']}](https://github.com/{org}/{commit['repo']})
+**Author:** {commit['author']} ({commit['author_login']})
+**Date:** {commit['date']}
+**Branch(es):** {commit['appears_in_branches']}
+**Commit Link:** [View on GitHub]({commit['commit_link']})
+
+## Commit Message
+```
+{commit['message']}
+```
+
+"""
+    chunks = [header]
     
     # Add statistics if available
     if commit.get("stats"):
         stats = commit["stats"]
-        content.append(f"## Statistics")
-        content.append(f"- **Files changed:** {commit.get('files_changed', 0)}")
-        content.append(f"- **Lines added:** {stats['total_additions']}")
-        content.append(f"- **Lines deleted:** {stats['total_deletions']}")
-        content.append(f"- **Total changes:** {stats['total_changes']}")
-        content.append(f"")
-    
-    # Add file changes
-    if commit.get("files"):
-        content.append(f"## File Changes")
-        content.append(f"")
-        
-        for file_info in commit["files"]:
-            status_emoji = {
-                "added": "🆕",
-                "modified": "✏️", 
-                "deleted": "🗑️",
-                "renamed": "🔄"
-            }
-            
-            emoji = status_emoji.get(file_info["status"], "📝")
-            content.append(f"### {emoji} {file_info['filename']} ({file_info['status']})")
-            
-            if file_info["additions"] or file_info["deletions"]:
-                content.append(f"**Changes:** +{file_info['additions']} -{file_info['deletions']}")
-            
-            if file_info.get("patch"):
-                content.append(f"")
-                content.append(f"```diff")
-                content.append(file_info["patch"])
-                content.append(f"```")
-            
-            content.append(f"")
+        chunks.append(f"""## Statistics
+- **Files changed:** {commit.get('files_changed', 0)}
+- **Lines added:** {stats['total_additions']}
+- **Lines deleted:** {stats['total_deletions']}
+- **Total changes:** {stats['total_changes']}
+
+""")
+    
+    # Add file changes, one section per file separated by a blank line
+    sections = []
+    for file_info in commit["files"]:
+        emoji = STATUS_EMOJI.get(file_info["status"], "📝")
+        section = f"### {emoji} {file_info['filename']} ({file_info['status']})\n"
+        
+        if file_info["additions"] or file_info["deletions"]:
+            section += f"**Changes:** +{file_info['additions']} -{file_info['deletions']}\n"
+        
+        if file_info.get("patch"):
+            section += f"\n```diff\n{file_info['patch']}\n```\n"
+        
+        sections.append(section)
+    chunks.append("## File Changes\n\n")
+    chunks.append("\n".join(sections))
     
     # Save to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(content))
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(chunks)
     
     return filepath
 
+def print_commits_table(commits, max_colwidth=60):
+    """Print commits as a plain-text table with left-aligned, width-limited columns."""
+    columns = ["date", "author", "repo", "message", "commit_link"]
+    
+    def cell(value):
+        # Commit messages are shown on a single line
+        text = " ".join(str(value).split())
+        return text if len(text) <= max_colwidth else text[:max_colwidth - 3] + "..."
+    
+    rows = [[cell(commit.get(column, "")) for column in columns] for commit in commits]
+    widths = [max(len(column), *(len(row[i]) for row in rows)) for i, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+
 def get_hourly_output_dir(base_dir="hourly_reports"):
     """Create and return hourly output directory with timestamp."""
     now = datetime.datetime.now()
@@ -404,27 +651,26 @@ def get_hourly_output_dir(base_dir="hourly_reports"):
     os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
-def save_hourly_report(df, summary, org, start_time, end_time, output_dir, save_individual_commits=True):
+def save_hourly_report(commits, summary, org, start_time, end_time, output_dir, save_individual_commits=True,
+                       failed_repos=()):
     """Save the hourly report to files."""
     timestamp = datetime.datetime.now().strftime("%H%M")  # Just hour and minute for hourly reports
     
     # Save CSV
     csv_path = os.path.join(output_dir, f"{org}_commits_{timestamp}.csv")
     
-    # Create a clean DataFrame for CSV (remove complex nested data)
-    csv_df = df.copy()
-    if 'files' in csv_df.columns:
-        csv_df = csv_df.drop(['files'], axis=1)
-    if 'stats' in csv_df.columns:
-        # Flatten stats into separate columns
-        if not csv_df.empty and csv_df.iloc[0].get('stats'):
-            csv_df['total_additions'] = csv_df['stats'].apply(lambda x: x.get('total_additions', 0) if x else 0)
-            csv_df['total_deletions'] = csv_df['stats'].apply(lambda x: x.get('total_deletions', 0) if x else 0)
-            csv_df['total_changes'] = csv_df['stats'].apply(lambda x: x.get('total_changes', 0) if x else 0)
-            csv_df['files_changed'] = csv_df['files_changed'] if 'files_changed' in csv_df.columns else 0
-        csv_df = csv_df.drop(['stats'], axis=1)
-    
-    csv_df.to_csv(csv_path, index=False)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for commit in commits:
+            # Flatten stats into separate columns
+            stats = commit.get("stats") or {}
+            writer.writerow({
+                **commit,
+                "total_additions": stats.get("total_additions", 0),
+                "total_deletions": stats.get("total_deletions", 0),
+                "total_changes": stats.get("total_changes", 0)
+            })
     
     # Save Markdown summary
     md_path = os.path.join(output_dir, f"{org}_summary_{timestamp}.md")
@@ -433,29 +679,30 @@ def save_hourly_report(df, summary, org, start_time, end_time, output_dir, save_
     
     # Save individual commit files
     individual_files = []
-    if save_individual_commits and not df.empty:
-        print(f"\nSaving individual commit files...")
-        for _, commit in df.iterrows():
-            commit_dict = commit.to_dict()
-            if commit_dict.get("files"):  # Only save if there are file changes
-                filepath = save_commit_details(commit_dict, org, output_dir)
+    if save_individual_commits and commits:
+        print("\nSaving individual commit files...")
+        for commit in commits:
+            if commit.get("files"):  # Only save if there are file changes
+                filepath = save_commit_details(commit, org, output_dir)
                 if filepath:
                     individual_files.append(filepath)
     
     # Save metadata file
     metadata_path = os.path.join(output_dir, "metadata.txt")
     with open(metadata_path, 'w', encoding='utf-8') as f:
-        f.write(f"GitHub Hourly Commit Collection\n")
+        f.write("GitHub Hourly Commit Collection\n")
         f.write(f"Organization: {org}\n")
         f.write(f"Start Time: {start_time}\n")
         f.write(f"End Time: {end_time}\n")
-        f.write(f"Total Commits: {len(df)}\n")
+        f.write(f"Total Commits: {len(commits)}\n")
+        if failed_repos:
+            f.write(f"Incomplete Repositories: {', '.join(failed_repos)}\n")
         f.write(f"Collection Time: {datetime.datetime.now().isoformat()}\n")
     
     print(f"\nHourly reports saved to: {output_dir}")
     print(f"  CSV: {os.path.basename(csv_path)}")
     print(f"  Markdown: {os.path.basename(md_path)}")
-    print(f"  Metadata: metadata.txt")
+    print("  Metadata: metadata.txt")
     if individual_files:
         print(f"  Individual commits: {len(individual_files)} files in commits/")
     
@@ -505,38 +752,40 @@ def main():
         print("=" * 80)
         
         # Fetch commits
-        commits = fetch_all_commits(
+        commits, failed_repos = asyncio.run(fetch_all_commits(
             organization, 
             api_key, 
             since=start_dt, 
             until=end_dt,
-            include_all_users=args.include_all_users
-        )
+            include_all_users=args.include_all_users,
+            # Patches are only rendered into the per-commit files
+            include_details=not args.no_individual_files
+        ))
         
         # Create hourly output directory
         output_dir = get_hourly_output_dir(args.output_dir)
         
         if not commits:
-            print(f"No commits found for the specified time range.")
+            print("No commits found for the specified time range.")
             # Still create metadata file for tracking
             metadata_path = os.path.join(output_dir, "metadata.txt")
             with open(metadata_path, 'w', encoding='utf-8') as f:
-                f.write(f"GitHub Hourly Commit Collection\n")
+                f.write("GitHub Hourly Commit Collection\n")
                 f.write(f"Organization: {organization}\n")
                 f.write(f"Start Time: {start_display}\n")
                 f.write(f"End Time: {end_display}\n")
-                f.write(f"Total Commits: 0\n")
+                f.write("Total Commits: 0\n")
+                if failed_repos:
+                    f.write(f"Incomplete Repositories: {', '.join(failed_repos)}\n")
                 f.write(f"Collection Time: {datetime.datetime.now().isoformat()}\n")
             print(f"Metadata saved to: {output_dir}")
-            return
+            return 1 if failed_repos else 0
         
-        # Create DataFrame
-        df = pd.DataFrame(commits)
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date", ascending=False)
+        # Newest commits first
+        commits = sorted(commits, key=lambda commit: parse_date(commit["date"]), reverse=True)
         
         # Generate summary
-        summary = generate_summary(df, organization, start_display, end_display)
+        summary = generate_summary(commits, organization, start_display, end_display, failed_repos)
         
         # Display results
         print("\n" + "=" * 80)
@@ -546,23 +795,24 @@ def main():
         
         # Save reports
         save_hourly_report(
-            df, summary, organization, start_display, end_display, output_dir,
-            save_individual_commits=(not args.no_individual_files)
+            commits, summary, organization, start_display, end_display, output_dir,
+            save_individual_commits=(not args.no_individual_files),
+            failed_repos=failed_repos
         )
         
         # Display sample commits
-        if len(df) > 0:
-            print(f"\n" + "=" * 80)
-            print(f"ALL COMMITS ({len(df)} total):")
+        if commits:
+            print("\n" + "=" * 80)
+            print(f"ALL COMMITS ({len(commits)} total):")
             print("=" * 80)
-            sample_df = df[['date', 'author', 'repo', 'message', 'commit_link']]
-            print(sample_df.to_string(index=False, max_colwidth=60))
+            print_commits_table(commits)
         
     except Exception as e:
         print(f"Error: {e}")
         return 1
     
-    return 0
+    # Non-zero so schedulers notice that some repositories are missing from the report
+    return 1 if failed_repos else 0
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
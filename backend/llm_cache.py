@@ -0,0 +1,36 @@
+import os
+import time
+import hashlib
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv('LLM_CACHE_DIR', '.llm_cache')
+CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', 86400))
+
+def cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256((model + "\0" + prompt).encode('utf-8')).hexdigest()
+
+def _cache_path(model: str, prompt: str) -> str:
+    return os.path.join(CACHE_DIR, f"{cache_key(model, prompt)}.html")
+
+def get(model: str, prompt: str) -> Optional[str]:
+    path = _cache_path(model, prompt)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            logger.info(f"LLM cache hit: {os.path.basename(path)}")
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def put(model: str, prompt: str, response: str) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(model, prompt)
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(response)
+    except Exception as e:
+        logger.error(f"Error writing LLM cache entry {path}: {e}")
@@ -1,38 +1,97 @@
 import os
 import logging
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Optional
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
-from fastapi.responses import HTMLResponse, FileResponse
+import time
+import queue
+import hashlib
+import ipaddress
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
+import httpx
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 
 from .core.config import settings
 from .core.github_collector import GitHubCollector
 from .core.claude_client import ClaudeClient
 from .core.post_generator import PostGenerator
+from .core.post_cache import PostCache
+from .core.post_index import post_index
 from .models.post import PostGenerationRequest, PostGenerationResponse, PostTemplate
-from .models.commit import CommitCollection
 
 # Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/app.log'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers only enqueue records; a QueueListener thread does the file and console writes
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('logs/app.log')
+_stream_handler = logging.StreamHandler()
+for _handler in (_file_handler, _stream_handler):
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+log_listener = QueueListener(_log_queue, _file_handler, _stream_handler, respect_handler_level=True)
+log_listener.start()
+
+# The queue side only renders the message (plus any traceback); the listener's handlers add the prefix
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(getattr(logging, settings.log_level.upper()))
+_root_logger.addHandler(_queue_handler)
 logger = logging.getLogger(__name__)
 
+# Startup and shutdown
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info(f"Starting {settings.app_name}")
+    
+    _workers.extend(asyncio.create_task(_worker()) for _ in range(settings.background_workers))
+    
+    # Sync the posts index and test connections concurrently
+    indexed, rate_limit, claude_connected = await asyncio.gather(
+        asyncio.to_thread(post_index.rebuild),
+        run_github(github_collector.check_rate_limit),
+        asyncio.to_thread(claude_client.test_connection),
+        return_exceptions=True
+    )
+    if isinstance(indexed, Exception):
+        logger.error(f"Error rebuilding posts index: {indexed}")
+    for name, result in (("GitHub API rate limit", rate_limit), ("Claude API connected", claude_connected)):
+        if isinstance(result, Exception):
+            logger.error(f"Error during startup ({name}): {result}")
+        else:
+            logger.info(f"{name}: {result}")
+    
+    yield
+    
+    logger.info(f"Shutting down {settings.app_name}")
+    
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    
+    http_client.close()
+    
+    # Flush queued log records before the process exits
+    log_listener.stop()
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.app_name,
     description="AI-powered GitHub repository changes explainer",
     version="1.0.0",
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -44,14 +103,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON listings and commit files; small responses aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Mount static files
 if os.path.exists(settings.static_files_dir):
     app.mount("/static", StaticFiles(directory=settings.static_files_dir), name="static")
 
 # Initialize core components
+# One pooled HTTP/2 client for all Claude calls; closed at shutdown
+http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    timeout=httpx.Timeout(600.0, connect=10.0)
+)
 github_collector = GitHubCollector()
-claude_client = ClaudeClient()
-post_generator = PostGenerator()
+claude_client = ClaudeClient(http_client=http_client)
+post_generator = PostGenerator(claude_client=claude_client)
+post_cache = PostCache()
+
+# The SDK clients are synchronous, so their calls run in worker threads via asyncio.to_thread;
+# the semaphore caps how many GitHub calls are in flight at once
+github_semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+
+async def run_github(func, *args):
+    async with github_semaphore:
+        return await asyncio.to_thread(func, *args)
+
+# Health probes reuse upstream results for a few seconds; the lock coalesces
+# concurrent probes into a single upstream call
+_health_cache: Dict[str, Tuple[float, Any]] = {}
+_health_locks = {"github": asyncio.Lock(), "claude": asyncio.Lock()}
+
+async def _cached_health_check(name: str, check):
+    async with _health_locks[name]:
+        cached = _health_cache.get(name)
+        if cached and time.monotonic() - cached[0] < settings.health_cache_ttl:
+            return cached[1]
+        result = await check()
+        _health_cache[name] = (time.monotonic(), result)
+        return result
+
+async def get_rate_limit_cached() -> Dict[str, Any]:
+    return await _cached_health_check("github", lambda: run_github(github_collector.check_rate_limit))
+
+async def get_claude_connected_cached() -> bool:
+    return await _cached_health_check("claude", lambda: asyncio.to_thread(claude_client.test_connection))
 
 # Request/Response models
 class HealthResponse(BaseModel):
@@ -74,27 +171,20 @@ class CommitCollectionResponse(BaseModel):
     end_time: datetime
     file_path: Optional[str] = None
 
-# Startup and shutdown events
-@app.on_event("startup")
-async def startup_event():
-    logger.info(f"Starting {settings.app_name}")
-    
-    # Test connections
-    try:
-        # Test GitHub API
-        rate_limit = github_collector.check_rate_limit()
-        logger.info(f"GitHub API rate limit: {rate_limit}")
-        
-        # Test Claude API
-        claude_connected = claude_client.test_connection()
-        logger.info(f"Claude API connected: {claude_connected}")
-        
-    except Exception as e:
-        logger.error(f"Error during startup: {e}")
+# Background jobs are (coroutine function, args) pairs consumed by a fixed pool of workers;
+# the bounded queue makes handlers wait for room instead of piling up unlimited work
+job_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.job_queue_size)
+_workers: List[asyncio.Task] = []
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info(f"Shutting down {settings.app_name}")
+async def _worker():
+    while True:
+        func, args = await job_queue.get()
+        try:
+            await func(*args)
+        except Exception as e:
+            logger.error(f"Background job {func.__name__}{args} failed: {e}")
+        finally:
+            job_queue.task_done()
 
 # Health check endpoint
 @app.get("/health", response_model=HealthResponse)
@@ -105,7 +195,7 @@ async def health_check():
     
     # Check GitHub API
     try:
-        rate_limit = github_collector.check_rate_limit()
+        rate_limit = await get_rate_limit_cached()
         services["github"] = {
             "status": "healthy",
             "rate_limit_remaining": rate_limit.get("core", {}).get("remaining", 0)
@@ -115,7 +205,7 @@ async def health_check():
     
     # Check Claude API
     try:
-        claude_connected = claude_client.test_connection()
+        claude_connected = await get_claude_connected_cached()
         services["claude"] = {"status": "healthy" if claude_connected else "unhealthy"}
     except Exception as e:
         services["claude"] = {"status": "unhealthy", "error": str(e)}
@@ -128,6 +218,21 @@ async def health_check():
     )
 
 # Collect commits endpoints
+HOURLY_COMMITS_DIR = os.path.join(settings.commit_data_dir, "hourly")
+_REPO_FILENAME_TABLE = str.maketrans('/', '_')
+
+def commit_file_path(repository: str, hours: int, timestamp: str) -> str:
+    return os.path.join(HOURLY_COMMITS_DIR, f"{repository.translate(_REPO_FILENAME_TABLE)}_{hours}h_{timestamp}.json")
+
+@dataclass
+class CollectResult:
+    repository: str
+    hours: int
+    commits_count: int
+    start_time: datetime
+    end_time: datetime
+    file_path: Optional[str] = None
+
 @app.post("/collect-commits/{repository}", response_model=CommitCollectionResponse)
 async def collect_commits(
     repository: str,
@@ -138,67 +243,140 @@ async def collect_commits(
     """Collect commits from a repository for the specified time period"""
     
     try:
-        logger.info(f"Collecting commits from {repository} for last {hours} hours")
-        
-        # Collect commits
-        commits = github_collector.get_commits_for_period(repository, hours)
-        
-        response = CommitCollectionResponse(
-            repository=repository,
-            time_period=f"{hours}h",
-            commits_count=len(commits.commits),
-            start_time=commits.start_time,
-            end_time=commits.end_time
-        )
-        
-        # Save to file if requested
-        if save_to_file:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{repository.replace('/', '_')}_{hours}h_{timestamp}.json"
-            filepath = os.path.join(settings.commit_data_dir, "hourly", filename)
-            
-            if background_tasks:
-                background_tasks.add_task(github_collector.save_commits_to_file, commits, filepath)
-            else:
-                github_collector.save_commits_to_file(commits, filepath)
-            
-            response.file_path = filepath
-        
-        return response
-        
+        result = await _do_collect(repository, hours, save_to_file, background_tasks)
     except Exception as e:
         logger.error(f"Error collecting commits: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return CommitCollectionResponse(
+        repository=result.repository,
+        time_period=f"{result.hours}h",
+        commits_count=result.commits_count,
+        start_time=result.start_time,
+        end_time=result.end_time,
+        file_path=result.file_path
+    )
+
+async def _do_collect(
+    repository: str,
+    hours: int,
+    save: bool = True,
+    background_tasks: Optional[BackgroundTasks] = None,
+    timestamp: Optional[str] = None
+) -> CollectResult:
+    """Collect and optionally save commits; batch callers pass one timestamp for all repositories"""
+    
+    logger.info(f"Collecting commits from {repository} for last {hours} hours")
+    
+    commits = await run_github(github_collector.get_commits_for_period, repository, hours)
+    result = CollectResult(repository, hours, len(commits.commits), commits.start_time, commits.end_time)
+    
+    if save:
+        result.file_path = commit_file_path(repository, hours, timestamp or datetime.now().strftime("%Y%m%d_%H%M%S"))
+        
+        if background_tasks:
+            background_tasks.add_task(github_collector.save_commits_to_file, commits, result.file_path)
+        else:
+            await asyncio.to_thread(github_collector.save_commits_to_file, commits, result.file_path)
+    
+    return result
 
 @app.post("/collect-all-repos")
 async def collect_all_repos(
     hours: int = 2,
-    background_tasks: BackgroundTasks = None
+    wait: bool = False
 ):
-    """Collect commits from all configured repositories"""
+    """Collect commits from all configured repositories, queued by default or inline with ?wait=true"""
     
     if not settings.github_repos:
         raise HTTPException(status_code=400, detail="No repositories configured")
     
-    results = []
+    # One timestamp names every file of this batch
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    for repo in settings.github_repos:
-        try:
-            if background_tasks:
-                background_tasks.add_task(collect_commits, repo, hours, True)
-                results.append({"repository": repo, "status": "queued"})
-            else:
-                result = await collect_commits(repo, hours, True)
-                results.append({"repository": repo, "status": "completed", "commits": result.commits_count})
-        except Exception as e:
-            logger.error(f"Error collecting from {repo}: {e}")
-            results.append({"repository": repo, "status": "error", "error": str(e)})
+    if wait:
+        return {"results": await collect_repos(settings.github_repos, hours, timestamp)}
     
-    return {"results": results}
+    for repo in settings.github_repos:
+        await job_queue.put((collect_repo, (repo, hours, timestamp)))
+    return {"results": [{"repository": repo, "status": "queued"} for repo in settings.github_repos], "queued": len(settings.github_repos)}
+
+async def collect_repo(repo: str, hours: int, timestamp: Optional[str] = None) -> dict:
+    try:
+        result = await _do_collect(repo, hours, timestamp=timestamp)
+        return {"repository": repo, "status": "completed", "commits": result.commits_count}
+    except Exception as e:
+        logger.error(f"Error collecting from {repo}: {e}")
+        return {"repository": repo, "status": "error", "error": str(e)}
+
+async def collect_repos(repositories: List[str], hours: int, timestamp: Optional[str] = None) -> List[dict]:
+    """Collect all repositories concurrently; run_github bounds the parallel GitHub calls"""
+    return await asyncio.gather(*[collect_repo(repo, hours, timestamp) for repo in repositories])
 
 # Generate posts endpoints
+# Sliding-window timestamps of generation calls per client, least recently active first
+_generate_post_hits: "OrderedDict[str, deque]" = OrderedDict()
+_trusted_proxies = [ipaddress.ip_network(net, strict=False) for net in settings.trusted_proxies]
+
+def generate_post_client(request: Request) -> str:
+    """Client address, taken from the proxy headers when the peer is a trusted proxy"""
+    host = request.client.host if request.client else "unknown"
+    try:
+        peer = ipaddress.ip_address(host)
+    except ValueError:
+        return host
+    
+    if any(peer in net for net in _trusted_proxies):
+        # nginx sets X-Real-IP to the address it saw and appends that same address to X-Forwarded-For
+        forwarded = request.headers.get("x-real-ip") or request.headers.get("x-forwarded-for", "").split(",")[-1].strip()
+        if forwarded:
+            return forwarded
+    return host
+
+def check_generate_post_rate_limit(client: str):
+    """Reject clients exceeding generate_post_rate_limit generations per generate_post_rate_period seconds"""
+    now = time.monotonic()
+    period = settings.generate_post_rate_period
+    
+    # Forget clients whose newest hit has left the window, so the mapping only holds active clients
+    while _generate_post_hits and now - next(iter(_generate_post_hits.values()))[-1] >= period:
+        _generate_post_hits.popitem(last=False)
+    
+    hits = _generate_post_hits.get(client, deque())
+    while hits and now - hits[0] >= period:
+        hits.popleft()
+    
+    if len(hits) >= settings.generate_post_rate_limit:
+        retry_after = int(period - (now - hits[0])) + 1
+        raise HTTPException(status_code=429, detail="Too many post generation requests", headers={"Retry-After": str(retry_after)})
+    
+    hits.append(now)
+    _generate_post_hits[client] = hits
+    _generate_post_hits.move_to_end(client)
+
+# In-flight generations by post cache key; duplicate concurrent requests await the same task
+_inflight: Dict[str, asyncio.Task] = {}
+
+async def generate_post_once(cache_key: str, request: PostGenerationRequest, commits, use_cache: bool) -> PostGenerationResponse:
+    messages = [c.message for c in commits.commits]
+    shas = [c.sha for c in commits.commits]
+    task = _inflight.get(cache_key)
+    if task is None:
+        async def run():
+            response = await asyncio.to_thread(post_generator.generate_post, request, commits)
+            if use_cache and response.success:
+                await asyncio.to_thread(post_cache.put, cache_key, response, request, messages, shas)
+            return response
+        
+        task = asyncio.create_task(run())
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+    
+    # Shielded so one disconnecting client doesn't cancel the generation for the others
+    return await asyncio.shield(task)
+
 @app.post("/generate-post", response_model=PostGenerationResponse)
-async def generate_post(request: PostGenerationRequest):
+async def generate_post(request: PostGenerationRequest, http_request: Request = None, no_cache: bool = False):
     """Generate a post for a specific repository and time period"""
     
     try:
@@ -211,13 +389,32 @@ async def generate_post(request: PostGenerationRequest):
             raise HTTPException(status_code=400, detail="Invalid time period format. Use format like '2h' or '24h'")
         
         # Collect commits
-        commits = github_collector.get_commits_for_period(request.repository, hours)
+        commits = await run_github(github_collector.get_commits_for_period, request.repository, hours)
         
         if not commits.commits:
             raise HTTPException(status_code=404, detail=f"No commits found for {request.repository} in the last {hours} hours")
         
+        # Identical request options and commit set reuse the previously generated post
+        use_cache = settings.llm_cache_enabled and not no_cache
+        shas = [c.sha for c in commits.commits]
+        cache_key = post_cache.make_key(request, shas)
+        if use_cache:
+            cached = await asyncio.to_thread(post_cache.get, cache_key)
+            if cached is None:
+                # Near-duplicate messages for the same request options, from a post that already covers these commits
+                cached = await asyncio.to_thread(
+                    post_cache.get_similar, request, [c.message for c in commits.commits], shas
+                )
+            if cached is not None:
+                return cached
+        
+        # Only requests that reach generation count against the per-client limit;
+        # background batch jobs call this directly without an HTTP request
+        if http_request is not None:
+            check_generate_post_rate_limit(generate_post_client(http_request))
+        
         # Generate post
-        response = post_generator.generate_post(request, commits)
+        response = await generate_post_once(cache_key, request, commits, use_cache)
         
         if not response.success:
             raise HTTPException(status_code=500, detail=response.error_message)
@@ -230,11 +427,25 @@ async def generate_post(request: PostGenerationRequest):
         logger.error(f"Error generating post: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Recently queued batch jobs, oldest first; schedulers re-firing within batch_dedup_ttl are skipped
+_recent_batch_jobs: "OrderedDict[tuple, float]" = OrderedDict()
+
+def _claim_batch_job(key: tuple) -> bool:
+    """Record the job key; False if the same job was queued within the TTL"""
+    now = time.monotonic()
+    while _recent_batch_jobs:
+        queued_at = next(iter(_recent_batch_jobs.values()))
+        if now - queued_at < settings.batch_dedup_ttl and len(_recent_batch_jobs) < settings.batch_dedup_size:
+            break
+        _recent_batch_jobs.popitem(last=False)
+    
+    if key in _recent_batch_jobs:
+        return False
+    _recent_batch_jobs[key] = now
+    return True
+
 @app.post("/generate-posts-batch")
-async def generate_posts_batch(
-    request: GeneratePostsRequest,
-    background_tasks: BackgroundTasks
-):
+async def generate_posts_batch(request: GeneratePostsRequest):
     """Generate posts for multiple repositories and time periods"""
     
     repositories = request.repositories or settings.github_repos
@@ -246,6 +457,14 @@ async def generate_posts_batch(
     
     for repo in repositories:
         for time_period in request.time_periods:
+            if not _claim_batch_job((repo, time_period, request.force_template, request.target_audience)):
+                tasks.append({
+                    "repository": repo,
+                    "time_period": time_period,
+                    "status": "deduped"
+                })
+                continue
+            
             post_request = PostGenerationRequest(
                 repository=repo,
                 time_period=time_period,
@@ -253,11 +472,7 @@ async def generate_posts_batch(
                 target_audience=request.target_audience
             )
             
-            # Add to background tasks
-            background_tasks.add_task(
-                generate_post_background, 
-                post_request
-            )
+            await job_queue.put((generate_post_background, (post_request,)))
             
             tasks.append({
                 "repository": repo,
@@ -265,7 +480,8 @@ async def generate_posts_batch(
                 "status": "queued"
             })
     
-    return {"tasks": tasks, "message": f"Queued {len(tasks)} post generation tasks"}
+    queued = sum(task["status"] == "queued" for task in tasks)
+    return {"tasks": tasks, "message": f"Queued {queued} post generation tasks"}
 
 async def generate_post_background(request: PostGenerationRequest):
     """Background task for generating posts"""
@@ -277,61 +493,94 @@ async def generate_post_background(request: PostGenerationRequest):
         logger.error(f"Background post generation failed for {request.repository}: {e}")
 
 # File serving endpoints
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison against each tag in If-None-Match; "*" matches any existing resource"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in header.split(","))
+
+class LargeFileResponse(FileResponse):
+    # Commit dumps can reach tens of MB; 1 MiB reads cut the per-chunk thread hops 16x
+    chunk_size = 1024 * 1024
+
+def conditional_file_response(
+    request: Request,
+    file_path: str,
+    stat: os.stat_result,
+    media_type: str,
+    response_class: type = FileResponse
+) -> Response:
+    """FileResponse with ETag/Last-Modified; answers 304 when the client already has this version"""
+    # Weak: GZipMiddleware may send these bytes re-encoded under the same tag
+    etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    # stat_result lets Starlette skip its own stat and emit Last-Modified/Content-Length from it
+    return response_class(file_path, media_type=media_type, stat_result=stat, headers=headers)
+
 @app.get("/posts/{time_period}/{filename}")
-async def get_post_file(time_period: str, filename: str):
+async def get_post_file(request: Request, time_period: str, filename: str):
     """Serve generated post HTML files"""
     
     file_path = os.path.join(settings.output_dir, time_period, filename)
     
-    if not os.path.exists(file_path):
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Post file not found")
     
-    return FileResponse(file_path, media_type="text/html")
+    return conditional_file_response(request, file_path, stat, "text/html")
 
 @app.get("/posts/{time_period}")
-async def list_posts(time_period: str):
+async def list_posts(request: Request, response: Response, time_period: str, limit: Optional[int] = None, offset: int = 0):
     """List all posts for a time period"""
     
-    posts_dir = os.path.join(settings.output_dir, time_period)
-    
-    if not os.path.exists(posts_dir):
-        return {"posts": []}
-    
-    posts = []
-    for filename in os.listdir(posts_dir):
-        if filename.endswith('.html'):
-            file_path = os.path.join(posts_dir, filename)
-            stat = os.stat(file_path)
-            
-            posts.append({
-                "filename": filename,
-                "created_at": datetime.fromtimestamp(stat.st_ctime),
-                "size": stat.st_size,
-                "url": f"/posts/{time_period}/{filename}"
-            })
+    # Weak ETag: the listing only changes when the period's posts do, and gzip may re-encode the body
+    version = await asyncio.to_thread(post_index.version, time_period)
+    etag = f'W/"{version}-{offset:x}-{-1 if limit is None else limit:x}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    # Sort by creation time, newest first
-    posts.sort(key=lambda x: x["created_at"], reverse=True)
+    # Newest first, served from the posts index
+    posts = await asyncio.to_thread(post_index.list_posts, time_period, limit, offset)
     
     return {"posts": posts}
 
 @app.get("/commits/{filename}")
-async def get_commit_file(filename: str):
+async def get_commit_file(request: Request, filename: str):
     """Serve commit data files"""
     
     # Check both hourly and processed directories
     for subdir in ["hourly", "processed"]:
         file_path = os.path.join(settings.commit_data_dir, subdir, filename)
-        if os.path.exists(file_path):
-            return FileResponse(file_path, media_type="application/json")
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            continue
+        return conditional_file_response(request, file_path, stat, "application/json", LargeFileResponse)
     
     raise HTTPException(status_code=404, detail="Commit file not found")
 
 # Analytics endpoints
 @app.get("/analytics/summary")
-async def get_analytics_summary():
+async def get_analytics_summary(request: Request, response: Response):
     """Get summary analytics for all repositories"""
     
+    counts = await asyncio.to_thread(post_index.count_by_period)
+    etag = f'W/"{hashlib.sha1(repr((len(settings.github_repos), sorted(counts.items()))).encode()).hexdigest()[:16]}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     summary = {
         "repositories": len(settings.github_repos),
         "total_posts_generated": 0,
@@ -341,18 +590,22 @@ async def get_analytics_summary():
     
     # Count posts by time period
     for time_period in ["2h", "24h"]:
-        posts_dir = os.path.join(settings.output_dir, time_period)
-        if os.path.exists(posts_dir):
-            post_count = len([f for f in os.listdir(posts_dir) if f.endswith('.html')])
-            summary["posts_by_period"][time_period] = post_count
-            summary["total_posts_generated"] += post_count
+        post_count = counts.get(time_period, 0)
+        summary["posts_by_period"][time_period] = post_count
+        summary["total_posts_generated"] += post_count
     
     return summary
 
 @app.get("/analytics/repository/{repository}")
-async def get_repository_analytics(repository: str):
+async def get_repository_analytics(request: Request, response: Response, repository: str):
     """Get analytics for a specific repository"""
     
+    # The placeholder body depends only on the repository name
+    etag = f'W/"{hashlib.sha1(repository.encode()).hexdigest()[:16]}"'
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
     # This would be enhanced with actual analytics data
     return {
         "repository": repository,
@@ -363,53 +616,58 @@ async def get_repository_analytics(repository: str):
     }
 
 # Root endpoint
+# The page is static, so the response is built once at import and reused for every request
+_ROOT_HTML = """
+<html>
+    <head>
+        <title>AI GitHub Explainer</title>
+        <style>
+            body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }
+            .endpoint { background: #f5f5f5; padding: 10px; margin: 10px 0; border-radius: 5px; }
+            .method { font-weight: bold; color: #0066cc; }
+        </style>
+    </head>
+    <body>
+        <h1>AI GitHub Explainer API</h1>
+        <p>Transform GitHub commits into engaging social media posts!</p>
+        
+        <h2>Available Endpoints:</h2>
+        
+        <div class="endpoint">
+            <span class="method">GET</span> /health - Health check
+        </div>
+        
+        <div class="endpoint">
+            <span class="method">POST</span> /collect-commits/{repository} - Collect commits
+        </div>
+        
+        <div class="endpoint">
+            <span class="method">POST</span> /generate-post - Generate a post
+        </div>
+        
+        <div class="endpoint">
+            <span class="method">GET</span> /posts/{time_period} - List posts
+        </div>
+        
+        <div class="endpoint">
+            <span class="method">GET</span> /posts/{time_period}/{filename} - View post
+        </div>
+        
+        <div class="endpoint">
+            <span class="method">GET</span> /docs - Interactive API documentation
+        </div>
+        
+        <p><a href="/docs">View Interactive API Documentation</a></p>
+    </body>
+</html>
+"""
+
+_ROOT_RESPONSE = HTMLResponse(content=_ROOT_HTML, headers={"Cache-Control": "public, max-age=3600"})
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Root endpoint with API documentation"""
-    return """
-    <html>
-        <head>
-            <title>AI GitHub Explainer</title>
-            <style>
-                body { font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; }
-                .endpoint { background: #f5f5f5; padding: 10px; margin: 10px 0; border-radius: 5px; }
-                .method { font-weight: bold; color: #0066cc; }
-            </style>
-        </head>
-        <body>
-            <h1>AI GitHub Explainer API</h1>
-            <p>Transform GitHub commits into engaging social media posts!</p>
-            
-            <h2>Available Endpoints:</h2>
-            
-            <div class="endpoint">
-                <span class="method">GET</span> /health - Health check
-            </div>
-            
-            <div class="endpoint">
-                <span class="method">POST</span> /collect-commits/{repository} - Collect commits
-            </div>
-            
-            <div class="endpoint">
-                <span class="method">POST</span> /generate-post - Generate a post
-            </div>
-            
-            <div class="endpoint">
-                <span class="method">GET</span> /posts/{time_period} - List posts
-            </div>
-            
-            <div class="endpoint">
-                <span class="method">GET</span> /posts/{time_period}/{filename} - View post
-            </div>
-            
-            <div class="endpoint">
-                <span class="method">GET</span> /docs - Interactive API documentation
-            </div>
-            
-            <p><a href="/docs">View Interactive API Documentation</a></p>
-        </body>
-    </html>
-    """
+    return _ROOT_RESPONSE
 
 if __name__ == "__main__":
     import uvicorn